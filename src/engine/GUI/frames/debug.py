@@ -18,7 +18,6 @@
 """
 Sample frame for the application GUI.
 """
-import os
 from typing import TYPE_CHECKING
 
 import imgui
@@ -48,6 +47,9 @@ class Debug(Frame):
             self._GUI_manager.get_window_width() - self.size[0] - 200,
             self._GUI_manager.get_window_height() - self.size[1])
 
+        # Process of the program, used to show the memory used
+        self.__process = psutil.Process()
+
     def render(self) -> None:
         """
         Render the main sample text.
@@ -60,7 +62,7 @@ class Debug(Frame):
         active_polygon = self._GUI_manager.get_active_polygon_id()
         active_model = self._GUI_manager.get_active_model_id()
         loading = self._GUI_manager.is_program_loading()
-        memory_usage_mb = (psutil.Process(os.getpid()).memory_info().rss / 1024 ** 2)
+        memory_usage_mb = (self.__process.memory_info().rss / 1024 ** 2)
         # cpu_percent = psutil.cpu_percent()
 
         self._begin_frame('Debug')
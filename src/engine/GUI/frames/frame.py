@@ -32,6 +32,8 @@ class Frame:
     Class to manager the frame behaviour. New frames must be children of this class.
     """
 
+    __slots__ = ('__position', '__size', '__applied_layout', '_GUI_manager')
+
     def __init__(self, gui_manager: 'GUIManager'):
         """
         Constructor of the class.
@@ -40,6 +42,9 @@ class Frame:
         self.__size = (400, 400)
         self._GUI_manager = gui_manager
 
+        # Position and size last applied to the imgui window when the frames are fixed, None if not applied
+        self.__applied_layout = None
+
     @property
     def position(self) -> tuple:
         """
@@ -81,33 +86,46 @@ class Frame:
         """
         self.__size = new_size
 
-    def _begin_frame(self, frame_name: str, additional_flags: int = None):
+    def _begin_frame(self, frame_name: str, additional_flags: int = None) -> bool:
         """
         Begin a new frame.
 
         Initialize all the logic related to the fix/unfix and the necessary flags for the frame to be rendered correctly
         on the GUI.
 
+        Imgui reports if the content of the frame is visible (the window is not collapsed nor clipped), frames can use
+        the returned value to skip the submission of their widgets, but _end_frame must always be called.
+
         Args:
             frame_name: Name of the frame to draw.
             additional_flags: Other flags to use on the frame.
 
-        Returns: None
+        Returns: True if the content of the frame is visible, False otherwise.
         """
         if self._GUI_manager.get_frame_fixed_state():
             flags = imgui.WINDOW_NO_MOVE | imgui.WINDOW_NO_COLLAPSE | imgui.WINDOW_NO_RESIZE | imgui.WINDOW_NO_FOCUS_ON_APPEARING
             flags = flags | additional_flags if additional_flags is not None else flags
-            imgui.begin(frame_name,
-                        False,
-                        flags)
-            imgui.set_window_position(self.position[0], self.position[1])
-            imgui.set_window_size(self.size[0], self.size[1], 0)
+            expanded, _ = imgui.begin(frame_name,
+                                      False,
+                                      flags)
+
+            # Fixed windows can not be moved nor resized, so the layout is only applied when it changes
+            layout = (self.__position, self.__size)
+            if layout != self.__applied_layout:
+                imgui.set_window_position(self.__position[0], self.__position[1])
+                imgui.set_window_size(self.__size[0], self.__size[1], 0)
+                self.__applied_layout = layout
         else:
             flags = imgui.WINDOW_NO_COLLAPSE | imgui.WINDOW_NO_FOCUS_ON_APPEARING
             flags = flags | additional_flags if additional_flags is not None else flags
-            imgui.begin(frame_name,
-                        False,
-                        flags)
+            expanded, _ = imgui.begin(frame_name,
+                                      False,
+                                      flags)
+
+            # The window can be moved, so the layout must be applied again when the frames are fixed
+            self.__applied_layout = None
+
+        return expanded
 
     def _end_frame(self):
         """
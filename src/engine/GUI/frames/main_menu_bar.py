@@ -54,6 +54,13 @@ class MainMenuBar(Frame):
         """
         super().__init__(gui_manager)
 
+        # Options to change the polygon mode of the models (label of the option, polygon mode, name for the logs)
+        self.__polygon_mode_options = (
+            ('Use points', GL.GL_POINT, 'points'),
+            ('Use wireframes', GL.GL_LINE, 'wireframes'),
+            ('Fill polygons', GL.GL_FILL, 'filled polygons')
+        )
+
     def __file_menu(self, model_loaded: bool):
         """
         Options that appear on the File option of the main menu bar.
@@ -64,28 +71,27 @@ class MainMenuBar(Frame):
         if imgui.begin_menu('File', True):
 
             # Option to open a NetCDF file
-            imgui.menu_item('Open NetCDF file...', 'Ctrl+O', False, True)
-            if imgui.is_item_clicked():
+            clicked, _ = imgui.menu_item('Open NetCDF file...', 'Ctrl+O', False, True)
+            if clicked:
                 self._GUI_manager.load_netcdf_file_with_dialog()
 
             # Option to open a CPT file
-            imgui.menu_item('Change CPT file...', 'Ctrl+T', False, model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Change CPT file...', 'Ctrl+T', False, model_loaded)
+            if clicked:
                 self._GUI_manager.change_color_file_with_dialog()
 
             # Option to load a Shapefile file
             imgui.separator()
-            imgui.menu_item('Load shapefile file...', 'Ctrl+L', False, model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Load shapefile file...', 'Ctrl+L', False, model_loaded)
+            if clicked:
                 log.debug('Clicked load shapefile...')
                 self._GUI_manager.load_shapefile_file_with_dialog()
 
             # Option to export the current model to NetCDF file
             imgui.separator()
-            imgui.menu_item('Export current model...', enabled=model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Export current model...', enabled=model_loaded)
+            if clicked:
                 self._GUI_manager.export_model_as_netcdf(self._GUI_manager.get_active_model_id())
-                imgui.close_current_popup()
 
             imgui.end_menu()
 
@@ -100,43 +106,34 @@ class MainMenuBar(Frame):
 
             # Option to fix/unfix the frames of the application
             if self._GUI_manager.get_frame_fixed_state():
-                imgui.menu_item('Unfix windows positions')
-                if imgui.is_item_clicked():
+                clicked, _ = imgui.menu_item('Unfix windows positions')
+                if clicked:
                     self._GUI_manager.fix_frames_position(False)
 
             else:
-                imgui.menu_item('Fix windows positions')
-                if imgui.is_item_clicked():
+                clicked, _ = imgui.menu_item('Fix windows positions')
+                if clicked:
                     self._GUI_manager.fix_frames_position(True)
 
             # Options to show the points of the map, lines, or to render the model of the map
             imgui.separator()
-            imgui.menu_item('Use points', enabled=model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
-                log.info("Rendering points")
-                self._GUI_manager.set_models_polygon_mode(GL.GL_POINT)
-
-            imgui.menu_item('Use wireframes', enabled=model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
-                log.info("Rendering wireframes")
-                self._GUI_manager.set_models_polygon_mode(GL.GL_LINE)
-
-            imgui.menu_item('Fill polygons', enabled=model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
-                log.info("Rendering filled polygons")
-                self._GUI_manager.set_models_polygon_mode(GL.GL_FILL)
+            for label, polygon_mode, mode_name in self.__polygon_mode_options:
+                clicked, _ = imgui.menu_item(label, enabled=model_loaded)
+                if clicked:
+                    log.info("Rendering %s", mode_name)
+                    self._GUI_manager.set_models_polygon_mode(polygon_mode)
 
             # Option to change to 2D/3D mode. Raise error if the program is in another mode other than 3D or 2D.
             imgui.separator()
             program_view_mode = self._GUI_manager.get_program_view_mode()
             if program_view_mode == ViewMode.mode_3d:
-                imgui.menu_item('Change to 2D view', enabled=model_loaded)
-                if imgui.is_item_clicked() and model_loaded:
+                clicked, _ = imgui.menu_item('Change to 2D view', enabled=model_loaded)
+                if clicked:
                     self._GUI_manager.set_program_view_mode(ViewMode.mode_2d)
 
             elif program_view_mode == ViewMode.mode_2d:
-                imgui.menu_item('Change to 3D view', enabled=model_loaded)
-                if imgui.is_item_clicked() and model_loaded:
+                clicked, _ = imgui.menu_item('Change to 3D view', enabled=model_loaded)
+                if clicked:
                     self._GUI_manager.set_program_view_mode(ViewMode.mode_3d)
 
             else:
@@ -154,8 +151,8 @@ class MainMenuBar(Frame):
         if imgui.begin_menu('Edit', True):
 
             # Option to undo the last executed action
-            imgui.menu_item('Undo', 'CTRL+Z', False, model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Undo', 'CTRL+Z', False, model_loaded)
+            if clicked:
                 self._GUI_manager.undo_action()
             imgui.end_menu()
 
@@ -177,37 +174,37 @@ class MainMenuBar(Frame):
 
             # Render the elements of the tools
             # --------------------------------
-            imgui.menu_item('Merge maps', None, False, model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Merge maps', None, False, model_loaded)
+            if clicked:
                 combine_map_modal = CombineMapModal(self._GUI_manager,
                                                     list(self._GUI_manager.get_model_names_dict().keys()),
                                                     list(self._GUI_manager.get_model_names_dict().values()))
                 self._GUI_manager.open_modal(combine_map_modal)
 
-            imgui.menu_item('Fill all polygons with NaN', None, False, should_execute_logic)
-            if imgui.is_item_clicked() and should_execute_logic:
+            clicked, _ = imgui.menu_item('Fill all polygons with NaN', None, False, should_execute_logic)
+            if clicked:
                 map_transformation = FillNanMapTransformation(self._GUI_manager.get_active_model_id())
                 self._GUI_manager.apply_map_transformation(map_transformation)
 
-            imgui.menu_item('Interpolate NaN values', None, False, model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Interpolate NaN values', None, False, model_loaded)
+            if clicked:
                 interpolate_nan_map_modal = InterpolateNanMapModal(self._GUI_manager,
                                                                    self._GUI_manager.get_active_model_id())
                 self._GUI_manager.open_modal(interpolate_nan_map_modal)
 
-            imgui.menu_item('Eliminate values surrounded by NaN', None, False, model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Eliminate values surrounded by NaN', None, False, model_loaded)
+            if clicked:
                 self._GUI_manager.open_modal(ConvolveNanModal(self._GUI_manager,
                                                               self._GUI_manager.get_active_model_id()))
 
-            imgui.menu_item('Subtract map heights', None, False, model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Subtract map heights', None, False, model_loaded)
+            if clicked:
                 self._GUI_manager.open_modal(SubtractMapModal(self._GUI_manager,
                                                               list(self._GUI_manager.get_model_names_dict().keys()),
                                                               list(self._GUI_manager.get_model_names_dict().values())))
 
-            imgui.menu_item('Replace values with Nan', None, False, model_loaded)
-            if imgui.is_item_clicked() and model_loaded:
+            clicked, _ = imgui.menu_item('Replace values with Nan', None, False, model_loaded)
+            if clicked:
                 self._GUI_manager.open_modal(ReplaceValuesWithNanModal(
                     self._GUI_manager,
                     list(self._GUI_manager.get_model_names_dict().keys()),
@@ -220,10 +217,9 @@ class MainMenuBar(Frame):
         Render the main menu bar on the screen.
         Returns: None
         """
-        current_model = self._GUI_manager.get_active_model_id()
-        model_loaded = current_model is not None
-
         if imgui.begin_main_menu_bar():
+            model_loaded = self._GUI_manager.get_active_model_id() is not None
+
             self.__file_menu(model_loaded)
 
             self.__edit_menu(model_loaded)
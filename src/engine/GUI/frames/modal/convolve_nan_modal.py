@@ -67,8 +67,7 @@ class ConvolveNanModal(Modal):
             imgui.push_item_width(50)
             _, self.__nan_percentage_limit = imgui.input_float('Minimum % of NaN surrounding the data.',
                                                                self.__nan_percentage_limit)
-            self.__nan_percentage_limit = 0 if self.__nan_percentage_limit < 0 else self.__nan_percentage_limit
-            self.__nan_percentage_limit = 100 if self.__nan_percentage_limit > 100 else self.__nan_percentage_limit
+            self.__nan_percentage_limit = min(100, max(0, self.__nan_percentage_limit))
             imgui.pop_item_width()
 
             # Input for the size of the kernel to use
@@ -76,7 +75,7 @@ class ConvolveNanModal(Modal):
             imgui.push_item_width(100)
             _, self.__kernel_size_selected = imgui.input_int('Distance to analyze from point.',
                                                              self.__kernel_size_selected)
-            self.__kernel_size_selected = 3 if self.__kernel_size_selected < 3 else self.__kernel_size_selected
+            self.__kernel_size_selected = max(3, self.__kernel_size_selected)
             imgui.pop_item_width()
 
             # Buttons to close or to apply the transformation
@@ -33,10 +33,14 @@ class Modal(Frame):
     Base class to use when defining modals on the GUI.
     """
 
+    __slots__ = ('__should_show', '__is_open', '__tool_before_pop_up', '__io')
+
     def __init__(self, gui_manager: 'GUIManager'):
         super().__init__(gui_manager)
         self.__should_show = True
+        self.__is_open = False
         self.__tool_before_pop_up: Union[str, None] = None
+        self.__io = imgui.get_io()
 
     def _begin_modal(self, modal_title: str) -> bool:
         """
@@ -70,16 +74,25 @@ class Modal(Frame):
 
             # Return the variable should_show to false since the modal was already opened
             self.__should_show = False
+            self.__is_open = True
+
+        # Do not ask imgui for the modal if it is not open
+        if not self.__is_open:
+            return False
 
         # Fix the size for the frame to be shown in the center of the program
         # -------------------------------------------------------------------
+        display_size = self.__io.display_size
         imgui.set_next_window_size(self.size[0], -1)
-        imgui.set_next_window_position(imgui.get_io().display_size.x * 0.5,
-                                       imgui.get_io().display_size.y * 0.5,
+        imgui.set_next_window_position(display_size.x * 0.5,
+                                       display_size.y * 0.5,
                                        imgui.ALWAYS,
                                        0.5,
                                        0.5)
-        return imgui.begin_popup_modal(modal_title)[0]
+
+        # Keep track of the modal being closed by imgui
+        self.__is_open = imgui.begin_popup_modal(modal_title)[0]
+        return self.__is_open
 
     def _close_modal(self) -> None:
         """
@@ -90,6 +103,7 @@ class Modal(Frame):
         Returns: None
         """
         imgui.close_current_popup()
+        self.__is_open = False
 
         self._GUI_manager.close_modal(self)
         self._GUI_manager.set_active_tool(self.__tool_before_pop_up)
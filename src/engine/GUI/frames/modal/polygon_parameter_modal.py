@@ -77,6 +77,10 @@ class PolygonParameterModal(Modal):
             self.__key_string_value = str(self.__parameter_to_edit[0])
             self.__value_string_value = str(self.__parameter_to_edit[1])
 
+        # Texts and checks that only change when the inputs are modified
+        self.__parameter_name_text = f'Parameter: {self.__key_string_value}'
+        self.__is_value_numeric = self.__check_numeric(self.__value_string_value)
+
     def post_render(self) -> None:
         """
         Draw the modal to add/edit parameters from the polygons.
@@ -85,10 +89,6 @@ class PolygonParameterModal(Modal):
         """
         if self._begin_modal(self.__title):
 
-            # Get the data of the polygon and the parameters of the polygon
-            polygon_id = self.__polygon_to_edit
-            dict_parameters = dict(self._GUI_manager.get_polygon_parameters(polygon_id))
-
             # Render an input for the name of the parameter
             # Note: Fields stored in a shapefile file can not have name with more than 10 characters
             if self.__parameter_to_edit is None:
@@ -99,11 +99,12 @@ class PolygonParameterModal(Modal):
                                                               10)  # shapefile fields name can not exceed 10 characters
 
                 # Check if name already exist on polygon, if it already exists, then show an error message
+                dict_parameters = dict(self._GUI_manager.get_polygon_parameters(self.__polygon_to_edit))
                 repeated_name = True if self.__key_string_value in dict_parameters else False
                 if repeated_name:
                     imgui.text_colored('*Name can not be repeated', 1, 0, 0, 1)
             else:
-                imgui.text(f'Parameter: {self.__key_string_value}')
+                imgui.text(self.__parameter_name_text)
                 repeated_name = False
 
             # Render a selectable for the type of variable to create
@@ -131,7 +132,7 @@ class PolygonParameterModal(Modal):
                                                                              self.__current_variable_type)
 
                 # Store the value
-                self._GUI_manager.set_polygon_parameter(self._GUI_manager.get_active_polygon_id(),
+                self._GUI_manager.set_polygon_parameter(self.__polygon_to_edit,
                                                         self.__key_string_value,
                                                         value)
 
@@ -156,16 +157,21 @@ class PolygonParameterModal(Modal):
         # --------------------------------------------
         # text data
         if self.__current_variable_type == 0:
-            _, self.__value_string_value = imgui.input_text(' ',
-                                                            self.__value_string_value,
-                                                            self.__input_text_maximum_character_number)
+            changed, self.__value_string_value = imgui.input_text(' ',
+                                                                  self.__value_string_value,
+                                                                  self.__input_text_maximum_character_number)
+            if changed:
+                self.__is_value_numeric = self.__check_numeric(self.__value_string_value)
 
         # numeric data
         elif self.__current_variable_type == 1:
-            _, self.__value_string_value = imgui.input_text(' ',
-                                                            self.__value_string_value,
-                                                            self.__input_text_maximum_character_number)
-            if not self.__check_numeric(self.__value_string_value):
+            changed, self.__value_string_value = imgui.input_text(' ',
+                                                                  self.__value_string_value,
+                                                                  self.__input_text_maximum_character_number)
+            if changed:
+                self.__is_value_numeric = self.__check_numeric(self.__value_string_value)
+
+            if not self.__is_value_numeric:
                 imgui.text_colored('*Value is not a number', 1, 0, 0)
                 data_errors = True
 
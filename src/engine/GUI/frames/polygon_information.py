@@ -56,6 +56,33 @@ class PolygonInformation(Frame):
         super().__init__(gui_manager)
         self.size = (300, 300)
 
+        # Popup ids used for each one of the parameters, stored to not format them in every frame
+        self.__parameter_popup_id_dict = {}
+
+        # Popup id of the parameter whose options are opened, None if there is no popup opened
+        self.__opened_popup_id = None
+
+        # Size of the window used to compute the position of the frame
+        self.__window_size = None
+
+    def __get_parameter_popup_id(self, parameter_name: str) -> str:
+        """
+        Get the id of the popup with the options of a parameter.
+
+        The ids are generated only the first time that they are asked for.
+
+        Args:
+            parameter_name: Name of the parameter.
+
+        Returns: ID of the popup of the parameter.
+        """
+        popup_id = self.__parameter_popup_id_dict.get(parameter_name)
+        if popup_id is None:
+            popup_id = f'options for parameter {parameter_name}'
+            self.__parameter_popup_id_dict[parameter_name] = popup_id
+
+        return popup_id
+
     def render(self) -> None:
         """
         Render the frame.
@@ -66,80 +93,95 @@ class PolygonInformation(Frame):
         """
 
         # Do not draw the screen if there is no active polygon.
-        if self._GUI_manager.get_active_polygon_id() is not None:
-
-            # -----------
-            # Begin frame
-            # -----------
-            self.position = (self._GUI_manager.get_window_width() - self.size[0],
-                             self._GUI_manager.get_window_height() - self.size[1])
-            self._begin_frame('Polygon Information')
-
-            # --------------------------------------------
-            # First row, show the data titles in bold font
-            # --------------------------------------------
-            self._GUI_manager.set_font(Font.BOLD)
-            imgui.columns(2, 'Data List')
-            imgui.separator()
-            imgui.text("Field Name")
+        polygon_id = self._GUI_manager.get_active_polygon_id()
+        if polygon_id is None:
+            return
+
+        # Parameters of the polygon used on the frame
+        polygon_parameters = self._GUI_manager.get_polygon_parameters(polygon_id)
+
+        # -----------
+        # Begin frame
+        # -----------
+        window_size = (self._GUI_manager.get_window_width(), self._GUI_manager.get_window_height())
+        if window_size != self.__window_size:
+            self.position = (window_size[0] - self.size[0], window_size[1] - self.size[1])
+            self.__window_size = window_size
+        self._begin_frame('Polygon Information')
+
+        # --------------------------------------------
+        # First row, show the data titles in bold font
+        # --------------------------------------------
+        self._GUI_manager.set_font(Font.BOLD)
+        imgui.columns(2, 'Data List')
+        imgui.separator()
+        imgui.text("Field Name")
+        imgui.next_column()
+        imgui.text("Value")
+        imgui.separator()
+        self._GUI_manager.set_font(Font.REGULAR)
+
+        # ---------------------------------------------------------------------------------------------------------
+        # For each parameter defined in the polygon, show a new row on the frame with the name of the parameter and
+        # the value stored in the parameter. Also, configure the popup modal that will open in case that the
+        # parameter is clicked.
+        # ---------------------------------------------------------------------------------------------------------
+        right_mouse_clicked = imgui.is_mouse_clicked(1)
+        for parameter in polygon_parameters:
+            parameter_name, parameter_value = parameter
+            popup_id = self.__get_parameter_popup_id(parameter_name)
+
+            # Render the key of the parameter
+            imgui.next_column()
+            imgui.text(parameter_name)
+            if right_mouse_clicked and imgui.is_item_hovered():
+                imgui.open_popup(popup_id)
+                self.__opened_popup_id = popup_id
+
+            # Render the value of the parameter
             imgui.next_column()
-            imgui.text("Value")
+            imgui.text(str(parameter_value))
+            if right_mouse_clicked and imgui.is_item_hovered():
+                imgui.open_popup(popup_id)
+                self.__opened_popup_id = popup_id
             imgui.separator()
-            self._GUI_manager.set_font(Font.REGULAR)
-
-            # ---------------------------------------------------------------------------------------------------------
-            # For each parameter defined in the polygon, show a new row on the frame with the name of the parameter and
-            # the value stored in the parameter. Also, configure the popup modal that will open in case that the
-            # parameter is clicked.
-            # ---------------------------------------------------------------------------------------------------------
-            for parameter in self._GUI_manager.get_polygon_parameters(self._GUI_manager.get_active_polygon_id()):
-
-                # Render the key of the parameter
-                imgui.next_column()
-                imgui.text(parameter[0])
-                if imgui.is_item_hovered() and imgui.is_mouse_clicked(1):
-                    imgui.open_popup(f'options for parameter {parameter[0]}')
-
-                # Render the value of the parameter
-                imgui.next_column()
-                imgui.text(str(parameter[1]))
-                if imgui.is_item_hovered() and imgui.is_mouse_clicked(1):
-                    imgui.open_popup(f'options for parameter {parameter[0]}')
-                imgui.separator()
-
-                # Configure the popup options when the right click is pressed on the parameters
-                if imgui.begin_popup(f'options for parameter {parameter[0]}'):
-
-                    # Edit parameter option
-                    imgui.selectable('Edit')
-                    if imgui.is_item_clicked():
-                        polygon_parameter_modal = PolygonParameterModal(self._GUI_manager,
-                                                                        self._GUI_manager.get_active_polygon_id(),
-                                                                        parameter)
-                        self._GUI_manager.open_modal(polygon_parameter_modal)
-
-                    # Delete parameter option
-                    imgui.selectable('Delete')
-                    if imgui.is_item_clicked():
-                        # Set a confirmation modal before deleting the parameter
-                        # ------------------------------------------------------
-                        confirmation_modal = ConfirmationModal(self._GUI_manager)
-                        confirmation_modal.set_confirmation_text(
-                            'Delete parameter',
-                            f'Are you sure you want to delete {parameter[0]}?',
-                            lambda: self._GUI_manager.remove_polygon_parameter(
-                                self._GUI_manager.get_active_polygon_id(),
-                                parameter[0]),
-                            lambda: None)
-                        self._GUI_manager.open_modal(confirmation_modal)
-
-                    imgui.end_popup()
-
-            # Show a button to add a new parameter to the polygon at the end of the table
-            # ---------------------------------------------------------------------------
-            imgui.columns(1)
-            if imgui.button("Add New", -1):
+
+            # Configure the popup options when the right click is pressed on the parameters. Only the popup of the
+            # parameter that was clicked is checked.
+            if popup_id != self.__opened_popup_id:
+                continue
+
+            if not imgui.begin_popup(popup_id):
+                self.__opened_popup_id = None
+                continue
+
+            # Edit parameter option
+            imgui.selectable('Edit')
+            if imgui.is_item_clicked():
                 polygon_parameter_modal = PolygonParameterModal(self._GUI_manager,
-                                                                self._GUI_manager.get_active_polygon_id())
+                                                                polygon_id,
+                                                                parameter)
                 self._GUI_manager.open_modal(polygon_parameter_modal)
-            self._end_frame()
+
+            # Delete parameter option
+            imgui.selectable('Delete')
+            if imgui.is_item_clicked():
+                # Set a confirmation modal before deleting the parameter
+                # ------------------------------------------------------
+                confirmation_modal = ConfirmationModal(self._GUI_manager)
+                confirmation_modal.set_confirmation_text(
+                    'Delete parameter',
+                    f'Are you sure you want to delete {parameter_name}?',
+                    lambda name=parameter_name: self._GUI_manager.remove_polygon_parameter(polygon_id, name),
+                    lambda: None)
+                self._GUI_manager.open_modal(confirmation_modal)
+
+            imgui.end_popup()
+
+        # Show a button to add a new parameter to the polygon at the end of the table
+        # ---------------------------------------------------------------------------
+        imgui.columns(1)
+        if imgui.button("Add New", -1):
+            polygon_parameter_modal = PolygonParameterModal(self._GUI_manager, polygon_id)
+            self._GUI_manager.open_modal(polygon_parameter_modal)
+        self._end_frame()
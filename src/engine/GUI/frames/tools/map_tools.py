@@ -42,6 +42,25 @@ class MapTools:
         """
         self.__gui_manager = gui_manager
 
+        # Names of the models, only updated when the list of models changes
+        self.__model_list_version = -1
+        self.__model_name_items = ()
+        self.__model_id_items = ()
+        self.__model_popup_ids = {}
+
+    def __update_model_cache(self) -> None:
+        """
+        Update the names and ids of the models stored on the tool if the list of models changed since the last update.
+
+        Returns: None
+        """
+        model_list_version = self.__gui_manager.get_model_list_version()
+        if model_list_version != self.__model_list_version:
+            self.__model_name_items = tuple(self.__gui_manager.get_model_names_dict().items())
+            self.__model_id_items = tuple(self.__gui_manager.get_model_list())
+            self.__model_popup_ids = {model_id: f'popup_model_{model_id}' for model_id in self.__model_id_items}
+            self.__model_list_version = model_list_version
+
     def render(self) -> None:
         """
         Render the information of the maps.
@@ -58,32 +77,37 @@ class MapTools:
         Returns: Render the information of the maps inside some frame.
         """
 
+        gui_manager = self.__gui_manager
+
         # Render title of the tools
         # -------------------------
-        self.__gui_manager.set_font(Font.TOOL_TITLE)
+        gui_manager.set_font(Font.TOOL_TITLE)
         imgui.text('Map Tools')
-        self.__gui_manager.set_font(Font.REGULAR)
+        gui_manager.set_font(Font.REGULAR)
 
         # Render maps names
         # -----------------
-        model_name_dict = self.__gui_manager.get_model_names_dict()
-        active_model_id = self.__gui_manager.get_active_model_id()
-        hidden_models = self.__gui_manager.get_hidden_models()
+        self.__update_model_cache()
+
+        active_model_id = gui_manager.get_active_model_id()
+        hidden_models = gui_manager.get_hidden_models()
 
-        for key, value in model_name_dict.items():
+        for key, value in self.__model_name_items:
 
             # Render the checkbox for the model
-            imgui.push_style_color(imgui.COLOR_TEXT, 0.5, 0.5, 0.5) if key in hidden_models else None
-            clicked, current_state = imgui.checkbox(value,
-                                                    True if active_model_id == key else False)
-            imgui.pop_style_color() if key in hidden_models else None
+            is_hidden = key in hidden_models
+            if is_hidden:
+                imgui.push_style_color(imgui.COLOR_TEXT, 0.5, 0.5, 0.5)
+            clicked, current_state = imgui.checkbox(value, active_model_id == key)
+            if is_hidden:
+                imgui.pop_style_color()
 
             if imgui.is_item_clicked(1):
-                imgui.open_popup(f'popup_model_{key}')
+                imgui.open_popup(self.__model_popup_ids[key])
 
             # Set the model as active if checkbox is clicked
             if clicked:
-                self.__gui_manager.set_active_model(key)
+                gui_manager.set_active_model(key)
 
         # Set the logic for the popups
         # ----------------------------
@@ -98,11 +122,12 @@ class MapTools:
 
         Returns: None
         """
-        model_id_list = self.__gui_manager.get_model_list()
-        hidden_models = self.__gui_manager.get_hidden_models()
+        self.__update_model_cache()
+        gui_manager = self.__gui_manager
+        hidden_models = gui_manager.get_hidden_models()
 
-        for model_id in model_id_list:
-            if imgui.begin_popup(f'popup_model_{model_id}'):
+        for model_id in self.__model_id_items:
+            if imgui.begin_popup(self.__model_popup_ids[model_id]):
                 imgui.text("Select an action")
                 imgui.separator()
 
@@ -110,13 +135,13 @@ class MapTools:
                 # ---------------
                 imgui.selectable("Move up")
                 if imgui.is_item_clicked():
-                    self.__gui_manager.move_model_position(str(model_id), -1)
+                    gui_manager.move_model_position(str(model_id), -1)
 
                 # Move down the map
                 # -----------------
                 imgui.selectable("Move down")
                 if imgui.is_item_clicked():
-                    self.__gui_manager.move_model_position(str(model_id), 1)
+                    gui_manager.move_model_position(str(model_id), 1)
 
                 # Hide/Show map
                 # -------------
@@ -135,6 +160,6 @@ class MapTools:
                 imgui.separator()
                 imgui.selectable("Delete")
                 if imgui.is_item_clicked():
-                    self.__gui_manager.remove_model(model_id)
+                    gui_manager.remove_model(model_id)
 
                 imgui.end_popup()
@@ -156,11 +156,11 @@ class PolygonTools:
             # Update colors of the polygon only if the parameters were changed.
             # -----------------------------------------------------------------
             if color_changed:
-                log.debug(f"Changing colors of lines of polygon with id {polygon_id}")
+                log.debug("Changing colors of lines of polygon with id %s", polygon_id)
                 self.__GUI_manager.change_color_of_polygon(polygon_id, color_selected_data['polygon'])
 
             if dot_color_changed or hide_dots_changed:
-                log.debug(f"Changing colors of dots of polygon with id {polygon_id}")
+                log.debug("Changing colors of dots of polygon with id %s", polygon_id)
                 self.__GUI_manager.change_dot_color_of_polygon(polygon_id, color_selected_data['dot'])
 
             # return the normal tool and close the pop up
@@ -224,7 +224,7 @@ class PolygonTools:
 
         imgui.selectable('Delete')
         if imgui.is_item_clicked():
-            log.debug(f"Delete polygon with id: {polygon_id}")
+            log.debug("Delete polygon with id: %s", polygon_id)
             clicked_selectable = True
 
             # noinspection PyMissingOrEmptyDocstring
@@ -260,7 +260,7 @@ class PolygonTools:
 
         imgui.selectable('Export to shapefile')
         if imgui.is_item_clicked():
-            log.debug(f"Exporting polygon with id: {polygon_id}")
+            log.debug("Exporting polygon with id: %s", polygon_id)
             clicked_selectable = True
 
             self.__GUI_manager.export_polygon_with_id(polygon_id)
@@ -19,7 +19,7 @@
 File with the class ReliefTools. Class in charge of render the Relief tools inside another frame.
 """
 
-from typing import List, TYPE_CHECKING, Union
+from typing import Dict, List, TYPE_CHECKING, Union
 
 import imgui
 
@@ -62,6 +62,17 @@ class ReliefTools:
         # Filter data
         # -----------
         self.__filter_options: List[any] = [HeightLessThan, HeightGreaterThan, IsIn, IsNotIn]
+        self.__filter_options_names: List[str] = [filter_class.name for filter_class in self.__filter_options]
+        self.__filter_options_index: Dict[any, int] = {filter_class: option_index
+                                                       for option_index, filter_class
+                                                       in enumerate(self.__filter_options)}
+        # Argument used to create each filter when it is selected on the GUI
+        self.__filter_default_arguments: Dict[any, Union[float, None]] = {
+            HeightLessThan: 0,
+            HeightGreaterThan: 0,
+            IsIn: None,
+            IsNotIn: None
+        }
         self.__filters: List[Filter] = []  # filters to apply on the polygon if the interpolation is triggered
 
         # Auxiliary variables
@@ -71,6 +82,37 @@ class ReliefTools:
         self.__max_min_data_values: List[float] = [0, 0]
         # Variable used to store the values returned by the asynchronous method calculate_max_min_height.
         self.__return_array_values: List[Union[float, None]] = [None, None]
+        # Polygons that can be used as arguments of the filters, only updated when the list of polygons or the active
+        # polygon changes.
+        self.__polygon_options_key = None
+        self.__polygon_options_ids: List[Union[str, None]] = []
+        self.__polygon_options_names: List[str] = []
+        self.__polygon_options_index: Dict[Union[str, None], int] = {}
+
+    def __update_polygon_options(self) -> None:
+        """
+        Update the list of polygons that can be used as arguments of the filters.
+
+        The active polygon is not included on the list and the None option is added at the beginning of it.
+
+        Returns: None
+        """
+        active_polygon_id = self.__gui_manager.get_active_polygon_id()
+        polygon_options_key = (self.__gui_manager.get_polygon_list_version(), active_polygon_id)
+        if polygon_options_key == self.__polygon_options_key:
+            return
+
+        polygon_list = [None]
+        polygon_list.extend(polygon_id
+                            for polygon_id in self.__gui_manager.get_polygon_id_list()
+                            if polygon_id != active_polygon_id)
+        polygon_list_names = ['None']
+        polygon_list_names.extend(self.__gui_manager.get_polygon_name(polygon_id) for polygon_id in polygon_list[1:])
+
+        self.__polygon_options_ids = polygon_list
+        self.__polygon_options_names = polygon_list_names
+        self.__polygon_options_index = {polygon_id: index for index, polygon_id in enumerate(polygon_list)}
+        self.__polygon_options_key = polygon_options_key
 
     def __render_input_value_height_filters(self, filter_obj: Union[HeightLessThan, HeightGreaterThan]):
         """
@@ -94,29 +136,19 @@ class ReliefTools:
 
         Returns: None
         """
-        # Get list with the polygons on the program and remove the active one
-        # -------------------------------------------------------------------
-        polygon_list = self.__gui_manager.get_polygon_id_list()
-
-        # Remove the active polygon and add the None option
-        # -------------------------------------------------
-        polygon_list.remove(self.__gui_manager.get_active_polygon_id())
-        polygon_list_names = list(map(lambda x: self.__gui_manager.get_polygon_name(x), polygon_list))
-
-        polygon_list.insert(0, None)
-        polygon_list_names.insert(0, 'None')
-
         # If polygon for filter no longer in the list, replace the values as None
         # -----------------------------------------------------------------------
-        if filter_obj.polygon_id not in polygon_list:
+        polygon_index = self.__polygon_options_index.get(filter_obj.polygon_id)
+        if polygon_index is None:
             filter_obj.polygon_id = None
+            polygon_index = 0
 
         # Show the combo options for the rendering
         # ----------------------------------------
         _, selected_polygon = imgui.combo('Value',
-                                          polygon_list.index(filter_obj.polygon_id),
-                                          polygon_list_names)
-        filter_obj.polygon_id = polygon_list[selected_polygon]
+                                          polygon_index,
+                                          self.__polygon_options_names)
+        filter_obj.polygon_id = self.__polygon_options_ids[selected_polygon]
 
     def current_height_information(self, active_model_id, active_polygon_id) -> None:
         """
@@ -134,16 +166,20 @@ class ReliefTools:
         if active_polygon_id not in self.__polygon_data:
             self.__polygon_data[active_polygon_id] = {
                 'max_height': 'Not Calculated',
-                'min_height': 'Not Calculated'
+                'min_height': 'Not Calculated',
+                'text': 'Max height: Not Calculated\nMin height: Not Calculated'
             }
 
         # Update the values of the minimum and maximum height if they were calculated
         # ---------------------------------------------------------------------------
-        if self.__return_array_values != [None, None]:
+        # The engine sets both values in the same task, so it is enough to check one of them.
+        if self.__return_array_values[0] is not None:
             self.__max_min_data_values[:] = self.__return_array_values[:]
 
-            self.__polygon_data[active_polygon_id]['max_height'] = max(self.__max_min_data_values)
-            self.__polygon_data[active_polygon_id]['min_height'] = min(self.__max_min_data_values)
+            polygon_data = self.__polygon_data[active_polygon_id]
+            polygon_data['max_height'] = max(self.__max_min_data_values)
+            polygon_data['min_height'] = min(self.__max_min_data_values)
+            polygon_data['text'] = f'Max height: {polygon_data["max_height"]}\nMin height: {polygon_data["min_height"]}'
 
             self.__return_array_values = [None, None]
 
@@ -152,15 +188,7 @@ class ReliefTools:
         self.__gui_manager.set_font(Font.TOOL_SUB_TITLE)
         imgui.text('Polygon Information')
         self.__gui_manager.set_font(Font.REGULAR)
-        imgui.columns(2, None, False)
-        imgui.text(f'Max height:')
-        imgui.next_column()
-        imgui.text(str(self.__polygon_data[active_polygon_id]['max_height']))
-        imgui.next_column()
-        imgui.text(f'Min height:')
-        imgui.next_column()
-        imgui.text(str(self.__polygon_data[active_polygon_id]['min_height']))
-        imgui.columns(1)
+        imgui.text(self.__polygon_data[active_polygon_id]['text'])
 
         if imgui.button('Recalculate Information', -1):
             log.debug('Recalculate polygon information')
@@ -175,44 +203,35 @@ class ReliefTools:
         Returns: None
         """
 
-        # Variable to store if it is necessary to delete a filter
-        # -------------------------------------------------------
-        filter_to_remove = None
+        # Variable to store the index of the filter to delete, -1 if there is no filter to delete
+        # --------------------------------------------------------------------------------------
+        filter_to_remove_index = -1
 
-        # Title of the section
-        # --------------------
-        self.__gui_manager.set_font(Font.TOOL_SUB_TITLE)
-        imgui.text_wrapped('Filters')
-        self.__gui_manager.set_font(Font.REGULAR)
+        # Polygons that can be selected on the filters
+        # --------------------------------------------
+        self.__update_polygon_options()
 
         # Render the filters on the GUI
         # -----------------------------
-        for ind, filter_obj in enumerate(self.__filters):
+        # Iterate over a snapshot since the filters can be replaced or removed while rendering them
+        for ind, filter_obj in enumerate(tuple(self.__filters)):
             # Push the ID since the elements of the filter will all have the same ID
             # ----------------------------------------------------------------------
             imgui.push_id(f"relief_tools_filter_{ind}")
 
             # Selection of the filter
             # -----------------------
-            filter_selected = -1
-            for option_index, filter_option in enumerate(self.__filter_options):
-                filter_selected = option_index if isinstance(filter_obj, filter_option) else filter_selected
+            filter_selected = self.__filter_options_index.get(type(filter_obj), -1)
 
             changed, selected_index = imgui.combo('Filter',
                                                   filter_selected,
-                                                  [filter_class.name for filter_class in self.__filter_options])
+                                                  self.__filter_options_names)
             if changed:
-                if self.__filter_options[selected_index] == HeightGreaterThan:
-                    self.__filters[ind] = HeightGreaterThan(0)
-                elif self.__filter_options[selected_index] == HeightLessThan:
-                    self.__filters[ind] = HeightLessThan(0)
-                elif self.__filter_options[selected_index] == IsIn:
-                    self.__filters[ind] = IsIn(None)
-                elif self.__filter_options[selected_index] == IsNotIn:
-                    self.__filters[ind] = IsNotIn(None)
-                else:
-                    raise NotImplementedError(f'Creation of filter of class {self.__filter_options[selected_index]}'
+                filter_class = self.__filter_options[selected_index]
+                if filter_class not in self.__filter_default_arguments:
+                    raise NotImplementedError(f'Creation of filter of class {filter_class}'
                                               f' not implemented on the frame.')
+                self.__filters[ind] = filter_class(self.__filter_default_arguments[filter_class])
 
             # Selection of the argument for the filter.
             # this vary depending on the filter selected
@@ -225,14 +244,14 @@ class ReliefTools:
             # Button to remove the filter
             # ---------------------------
             if imgui.button('Remove Filter'):
-                filter_to_remove = filter_obj
+                filter_to_remove_index = ind
 
             imgui.pop_id()
 
         # Remove the filter if the button to remove was pressed
         # -----------------------------------------------------
-        if filter_to_remove is not None:
-            self.__filters.remove(filter_to_remove)
+        if filter_to_remove_index >= 0:
+            del self.__filters[filter_to_remove_index]
 
         # Button to add more filters
         # --------------------------
@@ -250,12 +269,6 @@ class ReliefTools:
         Returns: None
         """
 
-        # Title of the section
-        # --------------------
-        self.__gui_manager.set_font(Font.TOOL_SUB_TITLE)
-        imgui.text('Transformation')
-        self.__gui_manager.set_font(Font.REGULAR)
-
         # Type  of transformation
         # -----------------------
         clicked, self.__selected_transformation_option = imgui.combo(
@@ -290,13 +303,15 @@ class ReliefTools:
         Render the relief tools to modify the relief of the model.
         Returns: None
         """
+        gui_manager = self.__gui_manager
+
         # get all the data necessary
-        active_polygon_id = self.__gui_manager.get_active_polygon_id()
-        active_model_id = self.__gui_manager.get_active_model_id()
+        active_polygon_id = gui_manager.get_active_polygon_id()
+        active_model_id = gui_manager.get_active_model_id()
 
-        self.__gui_manager.set_font(Font.TOOL_TITLE)
+        gui_manager.set_font(Font.TOOL_TITLE)
         imgui.text('Relief Tools')
-        self.__gui_manager.set_font(Font.REGULAR)
+        gui_manager.set_font(Font.REGULAR)
 
         # Current Height Information
         # --------------------------
@@ -304,8 +319,17 @@ class ReliefTools:
 
         # Filter Logic
         # ------------
-        self.filter_menu()
+        # The widgets of the sections are only submitted when their header is expanded
+        gui_manager.set_font(Font.TOOL_SUB_TITLE)
+        filters_expanded, _ = imgui.collapsing_header('Filters', flags=imgui.TREE_NODE_DEFAULT_OPEN)
+        gui_manager.set_font(Font.REGULAR)
+        if filters_expanded:
+            self.filter_menu()
 
         # Transformation Menu
         # -------------------
-        self.transformation_menu(active_model_id, active_polygon_id)
+        gui_manager.set_font(Font.TOOL_SUB_TITLE)
+        transformation_expanded, _ = imgui.collapsing_header('Transformation', flags=imgui.TREE_NODE_DEFAULT_OPEN)
+        gui_manager.set_font(Font.REGULAR)
+        if transformation_expanded:
+            self.transformation_menu(active_model_id, active_polygon_id)
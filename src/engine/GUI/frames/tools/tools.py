@@ -58,6 +58,8 @@ class Tools(Frame):
             ProgramTools.move_map: 'Move Map',
             ProgramTools.create_polygon: 'Create Polygon'
         }
+        self.__active_tool_labels = {tool: f"Active tool: {tool_name}"
+                                     for tool, tool_name in self.__tools_names_dict.items()}
 
         # Generate the objects in charge of rendering the information of the different tools
         # ----------------------------------------------------------------------------------
@@ -71,7 +73,7 @@ class Tools(Frame):
         Show the active tool in a formatted way to the user.
         """
         self._GUI_manager.set_font(Font.BOLD)
-        imgui.text(f"Active tool: {self.__tools_names_dict.get(self._GUI_manager.get_active_tool(), None)}")
+        imgui.text(self.__active_tool_labels.get(self._GUI_manager.get_active_tool(), "Active tool: None"))
         self._GUI_manager.set_font(Font.REGULAR)
 
     def __show_visualization_tools(self) -> None:
@@ -82,13 +84,15 @@ class Tools(Frame):
         imgui.text("Visualization Tools")
         self._GUI_manager.set_font(Font.REGULAR)
 
-        if imgui.button("Zoom In", width=imgui.get_window_width() / 2 - self.__double_button_margin_width):
+        half_button_width = imgui.get_window_width() / 2 - self.__double_button_margin_width
+
+        if imgui.button("Zoom In", width=half_button_width):
             log.debug("Pressed button Zoom in")
             log.debug("----------------------")
             self._GUI_manager.add_zoom()
 
         imgui.same_line()
-        if imgui.button("Zoom Out", width=imgui.get_window_width() / 2 - self.__double_button_margin_width):
+        if imgui.button("Zoom Out", width=half_button_width):
             log.debug("Pressed button Zoom out")
             log.debug("-----------------------")
             self._GUI_manager.less_zoom()
@@ -107,7 +111,7 @@ class Tools(Frame):
         if changed:
             log.debug("Changed slide bar quality")
             log.debug("------------------------")
-            log.debug(f"Changed to value {values}")
+            log.debug("Changed to value %s", values)
             self.__slide_bar_quality = values
             self._GUI_manager.change_map_quality(values)
 
@@ -133,7 +137,9 @@ class Tools(Frame):
         # --------------------------------------
         self.size = (self._GUI_manager.get_left_frame_width(),
                      self._GUI_manager.get_window_height() - self._GUI_manager.get_main_menu_bar_height())
-        self._begin_frame('Tools')
+        if not self._begin_frame('Tools'):
+            self._end_frame()
+            return
 
         # Show the active tool on the application
         # ---------------------------------------
@@ -55,6 +55,14 @@ class Tools3D(Frame):
         self.__map_position_units = ['Degrees']
         self.__map_position_units_selected = 0
 
+        # Texts with the information of the camera, only generated again when the camera changes
+        self.__camera_data_key = None
+        self.__camera_texts = ('', '', '', '')
+
+        # Text with the exaggeration factor of the active model, only generated again when the factor changes
+        self.__height_normalization_factor = None
+        self.__height_normalization_factor_text = ''
+
     def render(self) -> None:
         """
         Draw the components of the frame into the GUI.
@@ -62,29 +70,42 @@ class Tools3D(Frame):
         Returns: None
         """
 
+        gui_manager = self._GUI_manager
+
         # Create the window on the screen depending on the mode selected on the program
         # -----------------------------------------------------------------------------
-        self.size = (self._GUI_manager.get_left_frame_width(),
-                     self._GUI_manager.get_window_height() - self._GUI_manager.get_main_menu_bar_height())
-        self._begin_frame('Tools 3D')
+        self.size = (gui_manager.get_left_frame_width(),
+                     gui_manager.get_window_height() - gui_manager.get_main_menu_bar_height())
+        if not self._begin_frame('Tools 3D'):
+            self._end_frame()
+            return
 
         # ------------
         # Camera Tools
         # ------------
 
         # Add a title to the camera section
-        self._GUI_manager.set_font(Font.TOOL_SUB_TITLE)
+        gui_manager.set_font(Font.TOOL_SUB_TITLE)
         imgui.text('Camera Information')
-        self._GUI_manager.set_font(Font.REGULAR)
+        gui_manager.set_font(Font.REGULAR)
 
         # Get the camera data and show it in the frame
-        camera_data = self._GUI_manager.get_camera_data()
-        imgui.text(f'Elevation angle: {int(camera_data["elevation"])}°')
-        imgui.text(f'Azimuthal angle: {int(camera_data["azimuthal"])}°')
-        imgui.text(f'Radius: {camera_data["radius"]}')
-        imgui.text(f'Position: {camera_data["position"]}')
+        camera_data = gui_manager.get_camera_data()
+        camera_data_key = (int(camera_data["elevation"]),
+                           int(camera_data["azimuthal"]),
+                           camera_data["radius"],
+                           tuple(camera_data["position"]))
+        if camera_data_key != self.__camera_data_key:
+            self.__camera_texts = (f'Elevation angle: {camera_data_key[0]}°',
+                                   f'Azimuthal angle: {camera_data_key[1]}°',
+                                   f'Radius: {camera_data["radius"]}',
+                                   f'Position: {camera_data["position"]}')
+            self.__camera_data_key = camera_data_key
+
+        for camera_text in self.__camera_texts:
+            imgui.text(camera_text)
         if imgui.button('Reset Camera', -1):
-            self._GUI_manager.reset_camera_values()
+            gui_manager.reset_camera_values()
 
         imgui.separator()
 
@@ -93,14 +114,18 @@ class Tools3D(Frame):
         # ----------
 
         # Add a title to the view tools section
-        self._GUI_manager.set_font(Font.TOOL_SUB_TITLE)
+        gui_manager.set_font(Font.TOOL_SUB_TITLE)
         imgui.text('View Tools')
-        self._GUI_manager.set_font(Font.REGULAR)
+        gui_manager.set_font(Font.REGULAR)
 
         # Show the current exaggeration factor to the user and set an input section where the user can enter a new
         # value to use
         imgui.text('Elevation Exaggeration Factor')
-        imgui.text(f'Current value: {self._GUI_manager.get_height_normalization_factor_of_active_3D_model()}')
+        height_normalization_factor = gui_manager.get_height_normalization_factor_of_active_3D_model()
+        if height_normalization_factor != self.__height_normalization_factor:
+            self.__height_normalization_factor_text = f'Current value: {height_normalization_factor}'
+            self.__height_normalization_factor = height_normalization_factor
+        imgui.text(self.__height_normalization_factor_text)
         _, self.__normalization_height_value = imgui.input_float('New factor',
                                                                  self.__normalization_height_value,
                                                                  0,
@@ -109,14 +134,14 @@ class Tools3D(Frame):
         self.__normalization_height_value = max(self.__normalization_height_value, 0)
 
         # Disable the keyboard controller if the user is writing something on the GUI
-        if imgui.is_item_active() and self._GUI_manager.get_controller_keyboard_callback_state():
-            self._GUI_manager.set_controller_keyboard_callback_state(False)
-        if (not imgui.is_item_active()) and (not self._GUI_manager.get_controller_keyboard_callback_state()):
-            self._GUI_manager.set_controller_keyboard_callback_state(True)
+        if imgui.is_item_active() and gui_manager.get_controller_keyboard_callback_state():
+            gui_manager.set_controller_keyboard_callback_state(False)
+        if (not imgui.is_item_active()) and (not gui_manager.get_controller_keyboard_callback_state()):
+            gui_manager.set_controller_keyboard_callback_state(True)
 
         # Apply changes using the data written by the user in the options
         if imgui.button('Change Factor', -1):
-            self._GUI_manager.change_current_3D_model_normalization_factor(self.__normalization_height_value)
+            gui_manager.change_current_3D_model_normalization_factor(self.__normalization_height_value)
 
         imgui.separator()
 
@@ -125,9 +150,9 @@ class Tools3D(Frame):
         # ----------
 
         # Add a title to the unit tools section
-        self._GUI_manager.set_font(Font.TOOL_SUB_TITLE)
+        gui_manager.set_font(Font.TOOL_SUB_TITLE)
         imgui.text('Unit Tools')
-        self._GUI_manager.set_font(Font.REGULAR)
+        gui_manager.set_font(Font.REGULAR)
 
         # Render boxes where the user can select the measure unit of the maps and the heights
         imgui.text_wrapped('Height measure unit:')
@@ -141,12 +166,12 @@ class Tools3D(Frame):
 
         # Render a button where the user can update the information of the model
         if imgui.button('Update Model', -1):
-            self._GUI_manager.change_height_unit_current_3D_model(
+            gui_manager.change_height_unit_current_3D_model(
                 self.__heights_measure_units[self.__heights_measure_units_selected]
             )
-            self._GUI_manager.change_map_position_unit_current_3D_model(
+            gui_manager.change_map_position_unit_current_3D_model(
                 self.__map_position_units[self.__map_position_units_selected]
             )
-            self._GUI_manager.update_current_3D_model()
+            gui_manager.update_current_3D_model()
 
         self._end_frame()
@@ -35,7 +35,6 @@ import imgui
 from imgui.integrations.glfw import GlfwRenderer
 
 from src.engine.GUI.font import Font
-from src.engine.GUI.frames.debug import Debug
 from src.engine.GUI.frames.loading import Loading
 from src.engine.GUI.frames.main_menu_bar import MainMenuBar
 from src.engine.GUI.frames.modal.modal import Modal
@@ -104,7 +103,14 @@ class GUIManager:
         # ----------------
         self.__engine = engine
         self.__polygon_folder_manager = PolygonFolderManager()
+
+        # State of the frames asked by all the frames on every draw, only changed by the fix_frames_position method
+        self.__frames_fixed = engine.are_frames_fixed()
         self.__model_id_list = []
+        self.__model_list_version = 0
+        self.__model_names_dict = {}
+        self.__model_names_dict_version = 0
+        self.__polygon_list_version = 0
         self.__icons_dict = None
 
         # Frames used by the GUI
@@ -136,6 +142,11 @@ class GUIManager:
         # --------------------
         self.__is_mouse_inside_frame = False
 
+        # Redraw parameters
+        # -----------------
+        self.__redraw_frames_per_event = engine.get_gui_setting_data()['REDRAW_FRAMES']
+        self.__pending_redraw_frames = self.__redraw_frames_per_event
+
         self.__initialize_variables(window,
                                     debug_mode)
 
@@ -156,6 +167,7 @@ class GUIManager:
         # Add the polygon to the folder
         # -----------------------------
         self.__polygon_folder_manager.add_polygon_to_folder(folder_id, polygon_id)
+        self.__polygon_list_version += 1
 
         # Change the draw order of the polygon to match the showed folder on the GUI
         # --------------------------------------------------------------------------
@@ -201,6 +213,9 @@ class GUIManager:
         self.__load_icons()
 
         if debug_mode:
+            # The debug frame is only imported when used since it depends on psutil
+            from src.engine.GUI.frames.debug import Debug
+
             debug = Debug(self)
             test_window = TestWindow(self)
 
@@ -261,6 +276,7 @@ class GUIManager:
         Returns: Add the model to the list of models to be showed on the GUI.
         """
         self.__model_id_list.append(model_id)
+        self.__model_list_version += 1
 
     def add_polygon_to_gui(self, polygon_id: str, polygon_folder_id: str = None) -> None:
         """
@@ -486,6 +502,10 @@ class GUIManager:
                 self.__modal.post_render()
         imgui.end_frame()
 
+        # Count the frame as one of the frames that were pending to be redrawn
+        if self.__pending_redraw_frames > 0:
+            self.__pending_redraw_frames -= 1
+
         # check for the mouse component
         self.__is_mouse_inside_frame = imgui.get_io().want_capture_mouse
 
@@ -532,7 +552,7 @@ class GUIManager:
 
         Returns: None
         """
-        log.debug(f"Changing fixed positions: {value}")
+        log.debug("Changing fixed positions: %s", value)
 
         # Settings change depending if the frames are fixed or not
         if value:
@@ -543,6 +563,8 @@ class GUIManager:
             self.__engine.fix_frames(False)
             self.__engine.update_scene_viewport()
 
+        self.__frames_fixed = self.__engine.are_frames_fixed()
+
     def get_3d_model_list(self) -> List[str]:
         """
         Get the list of all 3D models generated in the program.
@@ -607,7 +629,22 @@ class GUIManager:
 
         Returns: if frames are fixed or not.
         """
-        return self.__engine.are_frames_fixed()
+        return self.__frames_fixed
+
+    def get_gui_char_callback(self) -> callable:
+        """
+        Get the char callback defined by IMGUI.
+
+        This callback is the one configured by IMGUI on GLFW, and thus, receives the same arguments that the one
+        that GLFW defines.
+
+        The function returned receives 2 parameters:
+            window: GLFW window used in the application.
+            char: Unicode code point of the character written.
+
+        Returns: Function used by imgui for the char callback
+        """
+        return self.__implementation.char_callback
 
     def get_gui_key_callback(self) -> callable:
         """
@@ -732,21 +769,38 @@ class GUIManager:
         """
         return self.__model_id_list
 
+    def get_model_list_version(self) -> int:
+        """
+        Get the version of the list of models on the GUI.
+
+        The version changes every time that a model is added, removed or moved on the list of models, so it can be
+        used by the frames to know when to update the information of the models they show.
+
+        Returns: Version of the list of models.
+        """
+        return self.__model_list_version
+
     def get_model_names_dict(self) -> Dict[str, Union[str, None]]:
         """
         Get a dictionary with the models on the program and their names.
 
         The dictionary uses the models ID as the key and the name as the values of the dictionary.
 
+        The dictionary is only generated again when the list of models changes, so it must not be modified by the
+        callers.
+
         Returns: Dictionary with the ID of the models and the name of each one.
         """
-        model_dict = {}
+        if self.__model_names_dict_version != self.__model_list_version:
+            model_dict = {}
+
+            for model_id in self.__model_id_list:
+                model_dict[model_id] = self.__engine.get_model_name(model_id)
 
-        for model_id in self.__model_id_list:
-            model_info = self.__engine.get_model_information(model_id)
-            model_dict[model_id] = model_info.get('name', None)
+            self.__model_names_dict = model_dict
+            self.__model_names_dict_version = self.__model_list_version
 
-        return model_dict
+        return self.__model_names_dict
 
     def get_polygon_folder_id_list(self) -> list:
         """
@@ -775,6 +829,17 @@ class GUIManager:
         """
         return self.__polygon_folder_manager.get_polygon_id_list()
 
+    def get_polygon_list_version(self) -> int:
+        """
+        Get the version of the list of polygons on the GUI.
+
+        The version changes every time that a polygon is added, removed, moved or renamed, so it can be used by the
+        frames to know when to update the information of the polygons they show.
+
+        Returns: Version of the list of polygons.
+        """
+        return self.__polygon_list_version
+
     def get_polygon_name(self, polygon_id: str) -> str:
         """
         Get the name of a polygon given its id
@@ -876,6 +941,14 @@ class GUIManager:
 
         return self.__engine.is_polygon_planar(polygon_id)
 
+    def is_redraw_needed(self) -> bool:
+        """
+        Return if the GUI must be drawn again or if the last frame drawn is still valid.
+
+        Returns: Boolean indicating if there are frames pending to be redrawn.
+        """
+        return self.__pending_redraw_frames > 0
+
     def is_program_loading(self) -> bool:
         """
         Return if the program is loading or not.
@@ -947,6 +1020,7 @@ class GUIManager:
 
         # Move the folder on the manager
         self.__polygon_folder_manager.move_folder_position(polygon_folder_id, movement_offset)
+        self.__polygon_list_version += 1
 
         # Change the draw order of the polygons inside the folder
         for polygon_id in self.get_polygons_id_from_polygon_folder(polygon_folder_id):
@@ -970,6 +1044,7 @@ class GUIManager:
         index = self.__model_id_list.index(model_id)
         self.__model_id_list.pop(index)
         self.__model_id_list.insert(index + offset, model_id)
+        self.__model_list_version += 1
 
         # Change the drawing priority on the Engine
         self.__engine.change_model_draw_priority(model_id, index + offset)
@@ -1004,6 +1079,7 @@ class GUIManager:
 
         # Move the position of the polygon in the respective folder
         self.__polygon_folder_manager.move_polygon_position(polygon_folder_id, polygon_id, movement_offset)
+        self.__polygon_list_version += 1
 
         # Update the draw order of the polygons
         self.__engine.change_polygon_draw_priority(polygon_id,
@@ -1026,6 +1102,7 @@ class GUIManager:
         # Move the polygon from one folder to the other
         # ---------------------------------------------
         self.__polygon_folder_manager.move_polygon_to_folder(old_folder_id, polygon_id, folder_id)
+        self.__polygon_list_version += 1
 
         # Change the draw order of the polygon to match the showed folder on the GUI
         # --------------------------------------------------------------------------
@@ -1121,6 +1198,7 @@ class GUIManager:
         Returns: None
         """
         self.__model_id_list.remove(model_id)
+        self.__model_list_version += 1
         self.__engine.remove_model(model_id)
 
     def remove_polygon_by_id(self, polygon_id: str) -> None:
@@ -1134,6 +1212,7 @@ class GUIManager:
         """
         # delete it from the folders
         self.__polygon_folder_manager.delete_polygon_from_all_folders(polygon_id)
+        self.__polygon_list_version += 1
 
         # delete the polygon from the engine
         self.__engine.remove_polygon_by_id(polygon_id)
@@ -1171,6 +1250,17 @@ class GUIManager:
         imgui.render()
         self.__implementation.render(imgui.get_draw_data())
 
+    def request_redraw(self) -> None:
+        """
+        Ask the GUI to be redrawn on the following frames.
+
+        Imgui needs more than one frame to update the state of the widgets (hover, popups, etc.) after an event, so
+        the number of frames redrawn is the one defined in the REDRAW_FRAMES setting.
+
+        Returns: None
+        """
+        self.__pending_redraw_frames = max(self.__pending_redraw_frames, self.__redraw_frames_per_event)
+
     def reset_camera_values(self) -> None:
         """
         Ask the engine to reset the values of the camera to it's initial values.
@@ -1294,6 +1384,7 @@ class GUIManager:
         Returns: None
         """
         self.__engine.set_polygon_name(polygon_id, new_name)
+        self.__polygon_list_version += 1
 
     def set_polygon_parameter(self, polygon_id: str, key: str, value: any) -> None:
         """
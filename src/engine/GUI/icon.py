@@ -41,7 +41,7 @@ class Icon:
 
         # load the image data
         image = Image.open(file_dir)
-        img_data = np.array(list(image.getdata()), np.uint8)
+        img_data = np.ascontiguousarray(image, dtype=np.uint8)
 
         # check the image format
         if image.mode == "RGB":
@@ -61,9 +61,14 @@ class Icon:
         GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_LINEAR)
 
         # Generate the texture in OpenGl
+        # The rows of the array are tightly packed, so RGB images whose row size is not a multiple of 4 need an
+        # unpack alignment of 1 to be read correctly.
+        unpack_alignment = 4 if img_data.strides[0] % 4 == 0 else 1
+        GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, unpack_alignment)
         GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, internalFormat, image.size[0], image.size[1], 0, glformat,
                         GL.GL_UNSIGNED_BYTE,
                         img_data)
+        GL.glPixelStorei(GL.GL_UNPACK_ALIGNMENT, 4)
 
     def get_texture_id(self) -> int:
         """
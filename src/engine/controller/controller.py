@@ -129,6 +129,27 @@ class Controller:
         """
         return self.__keyboard_callback_enabled
 
+    def get_char_callback(self, engine: 'Engine') -> Callable:
+        """
+        Get the callback function to use when a character is written.
+
+        This function only requests a redraw and then calls the char_callback defined by the GUI.
+
+        Args:
+            engine: Engine to use to execute the logic defined by the callback.
+
+        Returns: Function to use as callback.
+        """
+        # The callback of the GUI does not change, so it is asked only once instead of on every event
+        gui_char_callback = engine.get_gui_char_callback()
+
+        # noinspection PyMissingOrEmptyDocstring
+        def on_char(window, char):
+            engine.request_redraw()
+            gui_char_callback(window, char)
+
+        return on_char
+
     def get_cursor_position_callback(self, engine: 'Engine'):
         """
         Get the mouse movement callback function.
@@ -141,18 +162,20 @@ class Controller:
 
         # noinspection PyMissingOrEmptyDocstring
         def cursor_position_callback(_, x_pos, y_pos):
+            engine.request_redraw()
 
-            # get the active tool being used in the program
+            # get the active tool and the view mode being used in the program
             active_tool = engine.get_active_tool()
+            view_mode = engine.get_program_view_mode()
 
-            if engine.get_program_view_mode() == ViewMode.mode_2d:
+            if view_mode == ViewMode.mode_2d:
 
                 if active_tool == Tools.move_map and self.__move_map_tool_activated:
                     if self.__is_left_mouse_being_pressed:
                         engine.move_map_position(x_pos - self.__mouse_old_pos[0],
                                                  self.__mouse_old_pos[1] - y_pos)
 
-            if engine.get_program_view_mode() == ViewMode.mode_3d:
+            if view_mode == ViewMode.mode_3d:
 
                 if self.__is_mouse_middle_being_pressed:
                     engine.change_camera_elevation(
@@ -177,6 +200,7 @@ class Controller:
 
         # noinspection PyMissingOrEmptyDocstring
         def mouse_button_callback(window, button, action, _):
+            engine.request_redraw()
 
             # state of the controller
             if action == glfw.PRESS:
@@ -209,7 +233,7 @@ class Controller:
 
                             if self.__is_inside_scene(pos_x, pos_y, engine.get_scene_setting_data(),
                                                       engine.get_window_setting_data()):
-                                log.debug(f"Creating points for active polygon at: {pos_x} {pos_y}")
+                                log.debug("Creating points for active polygon at: %s %s", pos_x, pos_y)
 
                                 engine.add_new_vertex_to_active_polygon_using_window_coords(pos_x, pos_y)
 
@@ -233,9 +257,12 @@ class Controller:
 
         Returns: Function to call for the mouse wheel.
         """
+        # The callback of the GUI does not change, so it is asked only once instead of on every event
+        gui_scroll_callback = engine.get_gui_scroll_callback()
 
         # noinspection PyMissingOrEmptyDocstring
         def mouse_wheel_callback(window, x_offset, y_offset):
+            engine.request_redraw()
 
             # do something only if not hovering frames
             if not engine.is_mouse_hovering_frame():
@@ -254,7 +281,7 @@ class Controller:
                     if y_offset < 0:
                         engine.modify_camera_radius(1 * self.__radius_movement_velocity)
 
-            engine.get_gui_scroll_callback()(window, x_offset, y_offset)
+            gui_scroll_callback(window, x_offset, y_offset)
 
         return mouse_wheel_callback
 
@@ -270,6 +297,8 @@ class Controller:
 
         Returns: Function to use as callback.
         """
+        # The callback of the GUI does not change, so it is asked only once instead of on every event
+        gui_key_callback = engine.get_gui_key_callback()
 
         # define the on_key callback
         def on_key(window, key, scancode, action, mods):
@@ -283,6 +312,7 @@ class Controller:
             Does nothing but keep track of the keys pressed and released if the variable only_gui_keyboard_callback
             is set to True.
             """
+            engine.request_redraw()
 
             # update the state of the controller variables
             # work even when glfw callback is disabled
@@ -420,7 +450,7 @@ class Controller:
                         engine.move_camera_position((self.__camera_movement_velocity, 0, 0))
 
             # call the others callbacks defined in the program.
-            engine.get_gui_key_callback()(window, key, scancode, action, mods)
+            gui_key_callback(window, key, scancode, action, mods)
 
         return on_key
 
@@ -441,19 +471,36 @@ class Controller:
 
             Update the height and width settings and also update the scene values and viewport.
             """
-            log.debug(f"Windows resized to {width}x{height}")
+            engine.request_redraw()
+            log.debug("Windows resized to %sx%s", width, height)
 
             # In case window was minimized, do nothing
             if width == 0 and height == 0:
                 return
 
-            engine.change_height_window(height)
-            engine.change_width_window(width)
-            engine.update_scene_values()
+            engine.change_window_size(width, height)
             engine.update_scene_viewport()
 
         return on_resize
 
+    def get_window_redraw_callback(self, engine: 'Engine') -> Callable:
+        """
+        Get the callback for the window events that only require the window to be drawn again.
+
+        The callback can be used for the refresh, focus and iconify events of GLFW, ignoring their arguments.
+
+        Args:
+            engine: Engine to use to execute the logic defined by the callback.
+
+        Returns: Function to use as a callback.
+        """
+
+        # noinspection PyMissingOrEmptyDocstring
+        def on_window_redraw(*_):
+            engine.request_redraw()
+
+        return on_window_redraw
+
     def set_keyboard_callback(self, new_state: bool) -> None:
         """
         Enable/Disable the functionality of the keyboard callback function defined in the glfw call.
@@ -18,7 +18,10 @@
 """
 File that contains the Engine class. Class in charge of the management of all the logic of the application.
 """
+from functools import partial
+from itertools import count
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, TYPE_CHECKING, Union
 
 import glfw
@@ -59,6 +62,45 @@ if TYPE_CHECKING:
 
 log = get_logger(module='ENGINE')
 
+# Messages showed when an interpolation raises an error, by error code
+INTERPOLATION_ERROR_MESSAGES = {
+    1: 'There is not enough points in the polygon to do the interpolation.',
+    2: 'Distance must be greater than 0 to do the interpolation',
+    3: 'Model used for interpolation is not accepted by the program.',
+    4: 'Model not selected.',
+    5: 'Polygon not selected.',
+    6: 'Polygon selected is not planar.'
+}
+
+# Messages showed when the maximum and minimum height inside a polygon can not be calculated, by SceneError code
+MAX_MIN_HEIGHT_ERROR_MESSAGES = {
+    1: 'The polygon is not planar. Try using a planar polygon.',
+    2: 'The polygon must have at least 3 points to be able to calculate the information.',
+    3: 'The current model is not supported to use to update the height of the vertices, try using another type of '
+       'model.',
+    5: 'Polygon not found in the program.',
+    7: 'Model not found.'
+}
+
+# Message and name of the data compared for each code of the SceneError raised when a loaded model does not match the
+# active model
+MODEL_MISMATCH_ERRORS = {
+    9: ('The model loaded does not use the same values for the x-axis as the active model in the application.',
+        'x-axis'),
+    10: ('The model loaded does not use the same values for the y-axis as the active model in the application.',
+         'y-axis'),
+    11: ('The resolution of the model loaded is no the same as the active model.',
+         'shape')
+}
+
+# Name of the axis and name of the file with its accepted keys for each code of the NetCDFImportError raised when a
+# key is not found on the file
+NETCDF_KEY_ERRORS = {
+    2: ('latitude', 'latitude_keys.json'),
+    3: ('longitude', 'longitude_keys.json'),
+    4: ('height', 'height_keys.json')
+}
+
 
 class Engine:
     """
@@ -79,6 +121,9 @@ class Engine:
             program: Program to use to retrieve data.
             debug_mode: Boolean indicating if the engine should be in debug mode.
         """
+        # Data generated from the settings, stored by group with the version of the settings used to generate it
+        self.__settings_data_cache = {}
+
         self.program = program
         self.render = Render(self.get_window_setting_data(),
                              self.get_scene_setting_data(),
@@ -95,6 +140,24 @@ class Engine:
         self.__process_manager = ProcessManager()
         self.__thread_manager = ThreadManager()
         self.__task_manager = TaskManager()
+        self.__loading_frame_tasks_count = 0
+
+        # Set by the close callback of the window, so the main loop does not need to ask GLFW on every frame
+        self.__should_close = False
+
+        # Movement of the map accumulated between two frames, applied once before drawing the next frame
+        self.__pending_map_movement = [0, 0]
+
+        # Functions called by the render on every frame drawn, created once since they are the same on every frame
+        # Methods without arguments are used directly instead of being wrapped in a lambda
+        self.__frame_tasks = [self.gui_manager.process_input,
+                              lambda: self.scene.draw(
+                                  self.program.get_active_model(),
+                                  self.program.get_active_polygon_id(),
+                                  self.program.get_view_mode()
+                              ),
+                              self.gui_manager.draw_frames,
+                              self.gui_manager.render]
 
         self.__initialize_components()
 
@@ -107,8 +170,9 @@ class Engine:
         Returns: None
         """
         # Icon of the program
-        program_icon = Image.open('resources/icons/program_icons/icon_program.png')
-        glfw.set_window_icon(self.window, 1, [program_icon])
+        # GLFW copies the pixels of the image, so the file can be closed once the icon is set
+        with Image.open('resources/icons/program_icons/icon_program.png') as program_icon:
+            glfw.set_window_icon(self.window, 1, [program_icon])
 
         # CONTROLLER CODE
         glfw.set_key_callback(self.window, self.controller.get_on_key_callback(self))
@@ -116,6 +180,134 @@ class Engine:
         glfw.set_mouse_button_callback(self.window, self.controller.get_mouse_button_callback(self))
         glfw.set_cursor_pos_callback(self.window, self.controller.get_cursor_position_callback(self))
         glfw.set_scroll_callback(self.window, self.controller.get_mouse_scroll_callback(self))
+        glfw.set_char_callback(self.window, self.controller.get_char_callback(self))
+
+        # The content of the window is lost when it is exposed, restored or focused again, so it must be redrawn
+        window_redraw_callback = self.controller.get_window_redraw_callback(self)
+        glfw.set_window_refresh_callback(self.window, window_redraw_callback)
+        glfw.set_window_focus_callback(self.window, window_redraw_callback)
+        glfw.set_window_iconify_callback(self.window, window_redraw_callback)
+
+        # noinspection PyMissingOrEmptyDocstring
+        def close_callback(_):
+            self.__should_close = True
+
+        glfw.set_window_close_callback(self.window, close_callback)
+
+    def __apply_map_movement(self) -> None:
+        """
+        Move the map using the movement accumulated since the last frame drawn.
+
+        Returns: None
+        """
+        x_movement, y_movement = self.__pending_map_movement
+        if x_movement == 0 and y_movement == 0:
+            return
+
+        self.__pending_map_movement = [0, 0]
+
+        # Get the data to move the maps
+        width_scene = Settings.SCENE_WIDTH_X
+        height_scene = Settings.SCENE_HEIGHT_Y
+        showed_limits = self.scene.get_2D_showed_limits()
+        map_position = self.get_map_position()
+
+        # Calculate the amount to move the scene depending on the coordinates showed on the screen
+        # The more coordinates are showing on the scene, the bigger the movement.
+        map_position[0] += (x_movement * (showed_limits['right'] - showed_limits['left'])) / width_scene
+        map_position[1] += (y_movement * (showed_limits['top'] - showed_limits['bottom'])) / height_scene
+
+        # Update the position on the program
+        self.program.set_map_position(map_position)
+
+        # Update projection matrix
+        self.scene.invalidate_projection_matrix_2D()
+
+    def __end_loading_task(self) -> None:
+        """
+        Mark one of the tasks executed with the loading frame as finished.
+
+        The loading frame is only hidden after the last of the tasks that use it ends.
+
+        Returns: None
+        """
+        self.__loading_frame_tasks_count -= 1
+        if self.__loading_frame_tasks_count == 0:
+            self.program.set_loading(False)
+        self.request_redraw()
+
+    def __get_settings_data(self, settings_group: str, generate_data: callable) -> MappingProxyType:
+        """
+        Get the data of a group of settings, generating it again only if the settings changed since the last time
+        that it was generated.
+
+        The data is returned as a read-only view, so the same object can be shared with every caller.
+
+        Args:
+            settings_group: Name of the group of settings.
+            generate_data: Function that generates the dictionary with the data of the group.
+
+        Returns: Read-only dictionary with the data of the group of settings.
+        """
+        data_version, data = self.__settings_data_cache.get(settings_group, (None, None))
+        if data_version != Settings.VERSION:
+            data = MappingProxyType(generate_data())
+            self.__settings_data_cache[settings_group] = (Settings.VERSION, data)
+
+        return data
+
+    def __run_loading_task(self, task: callable) -> None:
+        """
+        Execute a task set with the loading frame.
+
+        Args:
+            task: Task to execute.
+
+        Returns: None
+        """
+        try:
+            task()
+        finally:
+            self.__end_loading_task()
+
+    def __show_new_vertex_error(self, error: PolygonError) -> None:
+        """
+        Show the modal with the message of an error raised while adding a new vertex to a polygon.
+
+        Args:
+            error: Error raised by the polygon.
+
+        Returns: None
+        """
+        if error.code == 0:
+            log.info('Handling line intersection.')
+            self.set_modal_text('Error', 'New line intersect another one already in the polygon.')
+
+        elif error.code == 1:
+            log.info('Handling repeated point.')
+            self.set_modal_text('Error', 'Point already exist in polygon.')
+
+    def __with_redraw(self, task: callable) -> callable:
+        """
+        Wrap a task so a redraw is requested after it is executed.
+
+        Used for the tasks executed by the managers outside the events of the window, so the changes they make are
+        drawn even if the main loop is waiting for events.
+
+        Args:
+            task: Task to wrap.
+
+        Returns: Function that receives the same arguments as the task.
+        """
+
+        # noinspection PyMissingOrEmptyDocstring
+        def task_and_redraw(*args):
+            try:
+                task(*args)
+            finally:
+                self.request_redraw()
+
+        return task_and_redraw
 
     @property
     def use_threads(self) -> bool:
@@ -176,13 +368,7 @@ class Engine:
                                                                   position_y,
                                                                   self.program.get_active_polygon_id())
         except PolygonError as e:
-            if e.code == 0:
-                log.info('Handling line intersection.')
-                self.set_modal_text('Error', 'New line intersect another one already in the polygon.')
-
-            elif e.code == 1:
-                log.info('Handling repeated point.')
-                self.set_modal_text('Error', 'Point already exist in polygon.')
+            self.__show_new_vertex_error(e)
 
     def add_new_vertex_to_active_polygon_using_window_coords(self, position_x: int, position_y: int) -> None:
         """
@@ -195,12 +381,16 @@ class Engine:
         Returns: None
         """
 
+        # Ask for the active polygon and model only once, they are used in the checks and to add the vertex
+        active_polygon_id = self.program.get_active_polygon_id()
+        active_model_id = self.program.get_active_model()
+
         # Check for the polygon and model to exist. if not, then open a modal text with a message explaining the error
-        if self.get_active_polygon_id() is None:
+        if active_polygon_id is None:
             self.set_modal_text('Error', 'Please select a polygon before adding a new vertex to it.')
             return
 
-        if self.get_active_model_id() is None:
+        if active_model_id is None:
             self.set_modal_text('Error', 'Please load a model before adding vertices to the polygon.')
             return
 
@@ -209,19 +399,13 @@ class Engine:
         try:
             self.scene.add_new_vertex_to_polygon_using_window_coords(position_x,
                                                                      position_y,
-                                                                     self.program.get_active_polygon_id(),
-                                                                     self.program.get_active_model(),
+                                                                     active_polygon_id,
+                                                                     active_model_id,
                                                                      self.get_scene_setting_data(),
                                                                      self.get_window_setting_data())
 
         except PolygonError as e:
-            if e.code == 0:
-                log.info('Handling line intersection.')
-                self.set_modal_text('Error', 'New line intersect another one already in the polygon.')
-
-            elif e.code == 1:
-                log.info('Handling repeated point.')
-                self.set_modal_text('Error', 'Point already exist in polygon.')
+            self.__show_new_vertex_error(e)
 
     def add_zoom(self) -> None:
         """
@@ -230,7 +414,7 @@ class Engine:
         Returns: None
         """
         self.program.add_zoom()
-        self.scene.update_projection_matrix_2D()
+        self.scene.invalidate_projection_matrix_2D()
 
     def apply_interpolation(self, interpolation: 'Interpolation') -> None:
         """
@@ -247,24 +431,11 @@ class Engine:
 
             interpolation.initialize(self.scene)
             self.scene.apply_interpolation(interpolation,
-                                           lambda: self.program.set_loading(False))
+                                           partial(self.program.set_loading, False))
 
         except InterpolationError as e:
-            if e.code == 1:
-                self.set_modal_text('Error', 'There is not enough points in the polygon to do'
-                                             ' the interpolation.')
-            elif e.code == 2:
-                self.set_modal_text('Error', 'Distance must be greater than 0 to do the '
-                                             'interpolation')
-            elif e.code == 3:
-                self.set_modal_text('Error', 'Model used for interpolation is not accepted by '
-                                             'the program.')
-            elif e.code == 4:
-                self.set_modal_text('Error', 'Model not selected.')
-            elif e.code == 5:
-                self.set_modal_text('Error', 'Polygon not selected.')
-            elif e.code == 6:
-                self.set_modal_text('Error', 'Polygon selected is not planar.')
+            if e.code in INTERPOLATION_ERROR_MESSAGES:
+                self.set_modal_text('Error', INTERPOLATION_ERROR_MESSAGES[e.code])
 
     def apply_map_transformation(self, map_transformation: 'MapTransformation') -> None:
         """
@@ -277,7 +448,7 @@ class Engine:
         """
         try:
             map_transformation.initialize(self.scene)
-            self.set_task_with_loading_frame(lambda: self.scene.apply_map_transformation(map_transformation),
+            self.set_task_with_loading_frame(partial(self.scene.apply_map_transformation, map_transformation),
                                              'Applying map transformation.')
 
         except MapTransformationError as e:
@@ -307,7 +478,7 @@ class Engine:
 
             # Run the transformation in a different thread
             # --------------------------------------------
-            self.set_task_with_loading_frame(lambda: self.scene.apply_transformation(transformation),
+            self.set_task_with_loading_frame(partial(self.scene.apply_transformation, transformation),
                                              'Applying transformation.')
 
         except FilterError as e:
@@ -380,8 +551,9 @@ class Engine:
          values will be stored in the return_data variable. In case of error, [None, None] will be set in the
          return_data variable.
 
-        This method is asynchronous, but it does not use threads or new process, it just set the execution of the code
-        some frames in the future to give time to the Loading windows to appear on the program.
+        The data of the model and the polygon is copied and checked on the main thread, showing the error messages
+        immediately. The values are calculated with the copy in another thread while the loading frame is showed, and
+        the return_data variable is updated in the main thread once the thread ends.
 
         Args:
             return_data: List with length 2 where to store the data.
@@ -392,53 +564,44 @@ class Engine:
         """
         assert len(return_data) == 2, 'List to use as return value must be of length 2'
 
-        def asynchronous_task(return_values):
-            """Task to execute in a future frame"""
+        # The data is copied on the main thread, so the thread never reads the scene while it is modified
+        try:
+            max_min_data = self.scene.get_max_min_height_data(model_id, polygon_id)
+
+        except SceneError as e:
+            return_data[0] = None
+            return_data[1] = None
+
+            if e.code in MAX_MIN_HEIGHT_ERROR_MESSAGES:
+                self.set_modal_text('Error', MAX_MIN_HEIGHT_ERROR_MESSAGES[e.code])
+                return
+            raise e
 
+        # The thread manager calls the then task without arguments if the thread fails
+        # noinspection PyMissingOrEmptyDocstring
+        def then_task(result=None):
             try:
-                max_value, min_value = self.scene.calculate_max_min_height(model_id, polygon_id)
-                return_values[0] = max_value
-                return_values[1] = min_value
+                if result is None:
+                    return_data[:] = [None, None]
+                    self.set_modal_text('Error', 'The maximum and minimum heights inside the polygon could not be '
+                                                 'calculated.')
+                    return
 
-            except SceneError as e:
-                if e.code == 1:
-                    self.set_modal_text('Error',
-                                        'The polygon is not planar. Try using a planar polygon.')
-                    return_values[0] = None
-                    return_values[1] = None
-
-                elif e.code == 2:
-                    self.set_modal_text('Error',
-                                        'The polygon must have at least 3 points to be able to '
-                                        'calculate the information.')
-                    return_values[0] = None
-                    return_values[1] = None
-
-                elif e.code == 3:
-                    self.set_modal_text('Error',
-                                        'The current model is not supported to use to update the '
-                                        'height of the vertices, try using another type of model.')
-                    return_values[0] = None
-                    return_values[1] = None
-
-                elif e.code == 5:
-                    self.set_modal_text('Error',
-                                        'Polygon not found in the program.')
-                    return_values[0] = None
-                    return_values[1] = None
-
-                elif e.code == 7:
-                    self.set_modal_text('Error',
-                                        'Model not found.')
-                    return_values[0] = None
-                    return_values[1] = None
+                max_min_values, polygon_mask = result
 
-                else:
-                    raise e
+                # The mask is only stored by the main thread, so the cache is never modified by two threads
+                self.scene.set_polygon_mask(model_id, polygon_id, max_min_data['mask_data'], polygon_mask)
+                return_data[0], return_data[1] = max_min_values
+
+            finally:
+                self.__end_loading_task()
+
+        # Show the loading frame until the thread ends
+        self.gui_manager.set_loading_message('Calculating heights...')
+        self.program.set_loading(True)
+        self.__loading_frame_tasks_count += 1
 
-        # Set the message for the loading frame and set the task to be executed behind a loading frame
-        self.set_task_with_loading_frame(lambda: asynchronous_task(return_data),
-                                         'Calculating heights...')
+        self.set_thread_task(Scene.calculate_max_min_height_from_data, then_task, parallel_task_args=[max_min_data])
 
     def change_3D_model_height_unit(self, model_id: str, measure_unit: str) -> None:
         """
@@ -553,6 +716,7 @@ class Engine:
         Returns: None
         """
         Settings.HEIGHT = height
+        Settings.update_version()
 
     def change_model_draw_priority(self, model_id: str, new_priority_value: int) -> None:
         """
@@ -596,6 +760,7 @@ class Engine:
         Returns: None
         """
         Settings.QUALITY = quality
+        Settings.update_version()
 
     def change_width_window(self, width: int) -> None:
         """
@@ -606,6 +771,19 @@ class Engine:
         Returns: None
         """
         Settings.WIDTH = width
+        Settings.update_version()
+
+    def change_window_size(self, width: int, height: int) -> None:
+        """
+        Change the engine settings width and height for the window, updating the settings of the scene with them.
+
+        Args:
+            width: New width
+            height: New height
+
+        Returns: None
+        """
+        Settings.change_window_size(width, height)
 
     def create_model_from_file(self, path_color_file: str, path_model: str, then: callable = lambda: None) -> None:
         """
@@ -678,51 +856,27 @@ class Engine:
         except SceneError as e:
             self.program.set_loading(False)
 
-            if e.code == 9:
-                self.set_modal_text('Error',
-                                    'The model loaded does not use the same values for the x-axis as the active '
-                                    'model in the application.\n'
-                                    f'Current model x-axis: {e.data.get("expected", None)}\n'
-                                    f'Loaded model x-axis: {e.data.get("actual", None)}')
-            elif e.code == 10:
+            if e.code in MODEL_MISMATCH_ERRORS:
+                message, data_name = MODEL_MISMATCH_ERRORS[e.code]
                 self.set_modal_text('Error',
-                                    'The model loaded does not use the same values for the y-axis as the active '
-                                    'model in the application.\n'
-                                    f'Current model y-axis: {e.data.get("expected", None)}\n'
-                                    f'Loaded model y-axis: {e.data.get("actual", None)}')
-            elif e.code == 11:
-                self.set_modal_text('Error',
-                                    'The resolution of the model loaded is no the same as the active model.\n'
-                                    f'Current model shape: {e.data.get("expected", None)}\n'
-                                    f'Loaded model shape: {e.data.get("actual", None)}'
-                                    )
+                                    f'{message}\n'
+                                    f'Current model {data_name}: {e.data.get("expected", None)}\n'
+                                    f'Loaded model {data_name}: {e.data.get("actual", None)}')
             else:
                 raise e
 
         except NetCDFImportError as e:
             self.program.set_loading(False)
 
-            if e.code == 2:
-                self.set_modal_text('Error',
-                                    f'{e.get_code_message()}\n\n'
-                                    f'Current keys on the file are: {list(e.data["file_keys"])}\n\n'
-                                    f'Keys accepted by the program for latitude are: {list(e.data["accepted_keys"])}'
-                                    f'\n\nTry adding a key to the latitude_keys.json file located in the resources '
-                                    f'folder and restarting the application.')
-            elif e.code == 3:
+            if e.code in NETCDF_KEY_ERRORS:
+                axis_name, keys_filename = NETCDF_KEY_ERRORS[e.code]
                 self.set_modal_text('Error',
                                     f'{e.get_code_message()}\n\n'
                                     f'Current keys on the file are: {list(e.data["file_keys"])}\n\n'
-                                    f'Keys accepted by the program for longitude are: {list(e.data["accepted_keys"])}'
-                                    f'\n\nTry adding a key to the longitude_keys.json file located in the resources '
+                                    f'Keys accepted by the program for {axis_name} are: '
+                                    f'{list(e.data["accepted_keys"])}'
+                                    f'\n\nTry adding a key to the {keys_filename} file located in the resources '
                                     f'folder and restarting the application.')
-            elif e.code == 4:
-                self.set_modal_text('Error',
-                                    f'{e.get_code_message()}\n\n'
-                                    f'Current keys on the file are: {list(e.data["file_keys"])}\n\n'
-                                    f'Keys accepted by the program for height are: {list(e.data["accepted_keys"])}'
-                                    f'\n\nTry adding a key to the height_keys.json file located in the resources folder'
-                                    f' and restarting the application.')
             else:
                 raise e
 
@@ -766,11 +920,11 @@ class Engine:
         # ---------------------------------
         error_polygons = []
         error_polygons_filename = str(Path(Path.cwd(), 'error_polygons'))
+        last_polygon_id = None
         for polygon_points, params in zip(polygons_point_list, polygons_param_list):
             try:
-                polygon_id = self.scene.create_new_polygon(polygon_points, params)
-                self.gui_manager.add_imported_polygon(polygon_id)
-                self.set_active_polygon(polygon_id)
+                last_polygon_id = self.scene.create_new_polygon(polygon_points, params)
+                self.gui_manager.add_imported_polygon(last_polygon_id)
 
             except PolygonError as e:
                 if e.code == 0:
@@ -784,6 +938,10 @@ class Engine:
                                                  f'polygons had errors.')
                 error_polygons.append((polygon_points, params))
 
+        # Only the last polygon loaded is set as the active polygon
+        if last_polygon_id is not None:
+            self.set_active_polygon(last_polygon_id)
+
         # Export the polygons with errors to a new file in the root directory
         # -------------------------------------------------------------------
         if len(error_polygons) != 0:
@@ -809,14 +967,17 @@ class Engine:
 
         Returns: None
         """
-        if not self.scene.is_polygon_planar(self.get_active_polygon_id()):
+        # Use the polygon active when the preview was asked, even if the active polygon changes before the task runs
+        active_polygon_id = self.get_active_polygon_id()
+
+        if not self.scene.is_polygon_planar(active_polygon_id):
             self.set_modal_text('Error', 'Polygon selected is not planar.')
             return
 
         def load_preview_logic():
             """Logic to load the preview of the polygons."""
             try:
-                self.scene.load_preview_interpolation_area(distance, self.get_active_polygon_id())
+                self.scene.load_preview_interpolation_area(distance, active_polygon_id)
 
             except SceneError as e:
                 if e.code == 2:
@@ -838,6 +999,12 @@ class Engine:
 
         Returns: None
         """
+        # Hide the window first so the program looks closed while the resources are returned
+        glfw.hide_window(self.window)
+
+        # Cancel the tasks that did not start, so the program does not wait for them to end before exiting
+        self.__thread_manager.shutdown()
+
         # Terminate process external to the engine, returning the resources to the OS.
         glfw.terminate()
 
@@ -859,7 +1026,7 @@ class Engine:
                     'Select a directory and filename for the shapefile file.',
                     'Relief Creator',
                     'Model')
-            if directory_file[-3:] != '.nc':
+            if not directory_file.endswith('.nc'):
                 directory_file += '.nc'
 
             # Ask the scene for information of the model
@@ -914,14 +1081,6 @@ class Engine:
 
         Returns: None
         """
-        points_list = []
-        parameters_list = []
-        names_list = []
-        for polygon_id in polygon_id_list:
-            points_list.append(self.scene.get_point_list_from_polygon(polygon_id))
-            parameters_list.append(dict(self.scene.get_polygon_params(polygon_id)))
-            names_list.append(self.scene.get_polygon_name(polygon_id))
-
         try:
             if directory_filename is None:
                 directory_filename = self.program.open_file_save_box_dialog(
@@ -932,6 +1091,9 @@ class Engine:
             self.set_modal_text('Error', 'Polygons not exported.')
             return
 
+        # Ask for the data of the polygons only once the directory is selected
+        points_list, parameters_list, names_list = self.scene.get_polygon_export_data(polygon_id_list)
+
         try:
             ShapefileExporter().export_list_of_polygons(points_list,
                                                         parameters_list,
@@ -1036,17 +1198,19 @@ class Engine:
         """
         return self.scene.get_camera_data()
 
-    def get_camera_settings(self) -> dict:
+    def get_camera_settings(self) -> MappingProxyType:
         """
         Get all the settings related to the camera.
 
+        The dictionary is only generated again when the settings change and can not be modified by the callers.
+
         Returns: Dictionary with the settings related to the camera.
         """
-        return {
+        return self.__get_settings_data('CAMERA', lambda: {
             'FIELD_OF_VIEW': Settings.FIELD_OF_VIEW,
             'PROJECTION_NEAR': Settings.PROJECTION_NEAR,
             'PROJECTION_FAR': Settings.PROJECTION_FAR
-        }
+        })
 
     def get_clear_color(self) -> list:
         """
@@ -1090,6 +1254,14 @@ class Engine:
         """
         return Settings.FLOAT_BYTES
 
+    def get_gui_char_callback(self) -> callable:
+        """
+        Get the char callback used by the gui
+
+        Returns: Function used as the char callback in the gui
+        """
+        return self.gui_manager.get_gui_char_callback()
+
     def get_gui_key_callback(self) -> callable:
         """
         Get the key callback used by the gui
@@ -1106,17 +1278,20 @@ class Engine:
         """
         return self.gui_manager.get_gui_mouse_scroll_callback()
 
-    def get_gui_setting_data(self) -> dict:
+    def get_gui_setting_data(self) -> MappingProxyType:
         """
         Get the GUI setting data.
 
+        The dictionary is only generated again when the settings change and can not be modified by the callers.
+
         Returns: Dictionary with the data related to the GUI.
         """
-        return {
+        return self.__get_settings_data('GUI', lambda: {
             'LEFT_FRAME_WIDTH': Settings.LEFT_FRAME_WIDTH,
             'TOP_FRAME_HEIGHT': Settings.TOP_FRAME_HEIGHT,
-            'MAIN_MENU_BAR_HEIGHT': Settings.MAIN_MENU_BAR_HEIGHT
-        }
+            'MAIN_MENU_BAR_HEIGHT': Settings.MAIN_MENU_BAR_HEIGHT,
+            'REDRAW_FRAMES': Settings.REDRAW_FRAMES
+        })
 
     def get_height_normalization_factor_of_active_3D_model(self) -> float:
         """
@@ -1224,6 +1399,17 @@ class Engine:
         """
         return self.scene.get_model_list()
 
+    def get_model_name(self, model_id: str) -> Union[str, None]:
+        """
+        Get the name of a model given its id.
+
+        Args:
+            model_id: Id of the model.
+
+        Returns: Name of the model.
+        """
+        return self.scene.get_model_name(model_id)
+
     def get_parameters_from_polygon(self, polygon_id: str) -> list:
         """
         Ask the scene for the parameters of certain polygon.
@@ -1281,46 +1467,52 @@ class Engine:
         """
         return Settings.QUALITY
 
-    def get_render_settings(self):
+    def get_render_settings(self) -> MappingProxyType:
         """
         Return a dictionary with the settings related to the render.
 
+        The dictionary is only generated again when the settings change and can not be modified by the callers.
+
         Returns: Dictionary with the render settings.
         """
-        return {
+        return self.__get_settings_data('RENDER', lambda: {
             "LINE_WIDTH": Settings.LINE_WIDTH,
             "POLYGON_LINE_WIDTH": Settings.POLYGON_LINE_WIDTH,
             "QUALITY": Settings.QUALITY,
             "DOT_SIZE": Settings.DOT_SIZE,
             "POLYGON_DOT_SIZE": Settings.POLYGON_DOT_SIZE,
             "ACTIVE_POLYGON_LINE_WIDTH": Settings.ACTIVE_POLYGON_LINE_WIDTH
-        }
+        })
 
-    def get_scene_setting_data(self) -> dict:
+    def get_scene_setting_data(self) -> MappingProxyType:
         """
         Get the scene setting data.
 
+        The dictionary is only generated again when the settings change and can not be modified by the callers.
+
         Returns: dict with the data.
         """
-        return {
+        return self.__get_settings_data('SCENE', lambda: {
             'SCENE_BEGIN_X': Settings.SCENE_BEGIN_X, 'SCENE_BEGIN_Y': Settings.SCENE_BEGIN_Y,
             'SCENE_WIDTH_X': Settings.SCENE_WIDTH_X, 'SCENE_HEIGHT_Y': Settings.SCENE_HEIGHT_Y
-        }
+        })
 
-    def get_window_setting_data(self) -> dict:
+    def get_window_setting_data(self) -> MappingProxyType:
         """
         Get the window setting data.
 
+        The dictionary is only generated again when the settings change and can not be modified by the callers.
+
         Returns: dict with the data.
         """
-        return {
+        return self.__get_settings_data('WINDOW', lambda: {
             'HEIGHT': Settings.HEIGHT,
             'WIDTH': Settings.WIDTH,
             'MAX_WIDTH': Settings.MAX_WIDTH,
             'MAX_HEIGHT': Settings.MAX_HEIGHT,
             'MIN_WIDTH': Settings.MIN_WIDTH,
             'MIN_HEIGHT': Settings.MIN_HEIGHT
-        }
+        })
 
     def get_zoom_level(self) -> float:
         """
@@ -1366,6 +1558,22 @@ class Engine:
         """
         return self.program.is_loading()
 
+    def is_redraw_needed(self) -> bool:
+        """
+        Check if the next frame must be drawn or if the last frame drawn is still valid.
+
+        Frames are always drawn while the program is loading so the loading frame is updated, while there are
+        tasks waiting, since the tasks wait for a number of frames and must not be delayed by the waits for events,
+        and while there are processes running, since their results are only checked on the frames drawn.
+
+        Returns: Boolean indicating if the next frame must be drawn.
+        """
+        if self.program.is_loading() or self.__task_manager.has_pending_tasks() or \
+                self.__process_manager.has_running_processes():
+            self.gui_manager.request_redraw()
+
+        return self.gui_manager.is_redraw_needed()
+
     def less_zoom(self) -> None:
         """
         Reduce on 1 the level of zoom.
@@ -1373,7 +1581,7 @@ class Engine:
         Returns: None
         """
         self.program.less_zoom()
-        self.scene.update_projection_matrix_2D()
+        self.scene.invalidate_projection_matrix_2D()
 
     def load_netcdf_file_with_dialog(self) -> None:
         """
@@ -1425,29 +1633,18 @@ class Engine:
         """
         Tell the scene to move given the parameters specified.
 
+        The movements are accumulated and applied once before drawing the next frame, so the many mouse events
+        generated between two frames only update the position of the map once.
+
         Args:
             x_movement: Movement in the x-axis
             y_movement: Movement in the y-axis
 
         Returns: None
         """
-
-        # Get the data to move the maps
-        width_scene = self.get_scene_setting_data()['SCENE_WIDTH_X']
-        height_scene = self.get_scene_setting_data()['SCENE_HEIGHT_Y']
-        showed_limits = self.scene.get_2D_showed_limits()
-        map_position = self.get_map_position()
-
-        # Calculate the amount to move the scene depending on the coordinates showed on the screen
-        # The more coordinates are showing on the scene, the bigger the movement.
-        map_position[0] += (x_movement * (showed_limits['right'] - showed_limits['left'])) / width_scene
-        map_position[1] += (y_movement * (showed_limits['top'] - showed_limits['bottom'])) / height_scene
-
-        # Update the position on the program
-        self.program.set_map_position(map_position)
-
-        # Update projection matrix
-        self.scene.update_projection_matrix_2D()
+        self.__pending_map_movement[0] += x_movement
+        self.__pending_map_movement[1] += y_movement
+        self.request_redraw()
 
     def optimize_gpu_memory(self) -> None:
         """
@@ -1538,7 +1735,6 @@ class Engine:
         Returns: None
         """
         self.scene.remove_model(model_id)
-        self.scene.remove_model_3d(model_id)
 
         if model_id == self.program.get_active_model():
             self.program.set_active_model(None)
@@ -1566,6 +1762,17 @@ class Engine:
         """
         self.scene.remove_polygon_by_id(polygon_id)
 
+    def request_redraw(self) -> None:
+        """
+        Ask the engine to draw the following frames.
+
+        Must be called every time that an event changes what is showed on the window, otherwise, the window will keep
+        showing the last frame drawn.
+
+        Returns: None
+        """
+        self.gui_manager.request_redraw()
+
     def reset_camera_values(self) -> None:
         """
         Ask the scene to reset the values of the camera.
@@ -1607,37 +1814,35 @@ class Engine:
         # Run the app for a fixed number of frames or until the user closes
         if n_frames is not None:
             assert type(n_frames) == int and n_frames > 0
-
-            # Run for the specified amount of frames
-            for _ in range(n_frames):
-                if glfw.window_should_close(self.window):
-                    break
-
-                self.__task_manager.update_tasks()
-                self.__thread_manager.update_threads()
-                self.__process_manager.update_process()
-                self.render.on_loop([lambda: self.gui_manager.process_input(),
-                                     lambda: self.scene.draw(
-                                         self.program.get_active_model(),
-                                         self.program.get_active_polygon_id(),
-                                         self.program.get_view_mode()
-                                     ),
-                                     lambda: self.gui_manager.draw_frames(),
-                                     lambda: self.gui_manager.render()])
-
+            frames = range(n_frames)
         else:
-            while not glfw.window_should_close(self.window):
-                self.__task_manager.update_tasks()
-                self.__thread_manager.update_threads()
-                self.__process_manager.update_process()
-                self.render.on_loop([lambda: self.gui_manager.process_input(),
-                                     lambda: self.scene.draw(
-                                         self.program.get_active_model(),
-                                         self.program.get_active_polygon_id(),
-                                         self.program.get_view_mode()
-                                     ),
-                                     lambda: self.gui_manager.draw_frames(),
-                                     lambda: self.gui_manager.render()])
+            frames = count()
+
+        # Bind the functions called on every frame to local variables, so they are not looked up again on each
+        # iteration of the loop
+        update_tasks = self.__task_manager.update_tasks
+        update_threads = self.__thread_manager.update_threads
+        update_process = self.__process_manager.update_process
+        is_redraw_needed = self.is_redraw_needed
+        apply_map_movement = self.__apply_map_movement
+        on_loop = self.render.on_loop
+        wait_events = self.render.wait_events
+        frame_tasks = self.__frame_tasks
+
+        for _ in frames:
+            if self.__should_close:
+                break
+
+            update_tasks()
+            update_threads()
+            update_process()
+
+            # Only draw the frame if something changed, otherwise wait for new events
+            if is_redraw_needed():
+                apply_map_movement()
+                on_loop(frame_tasks)
+            else:
+                wait_events(Settings.IDLE_WAIT_TIMEOUT)
 
         # Terminate the process if the app ended the process.
         if terminate_process:
@@ -1771,9 +1976,10 @@ class Engine:
         if then_task_args is None:
             then_task_args = []
 
+        # Draw the changes made by the then task once the process ends
         self.__process_manager.create_parallel_process(parallel_task,
                                                        parallel_task_args,
-                                                       then_task,
+                                                       self.__with_redraw(then_task),
                                                        then_task_args)
 
     def set_program_view_mode(self, mode: ViewMode = ViewMode.mode_2d) -> None:
@@ -1820,13 +2026,8 @@ class Engine:
             # Enable the loading frame and set the task to be executed after some frames
         if self.__wait_loading_frame_render:
             self.program.set_loading(True)
-
-            # noinspection PyMissingOrEmptyDocstring
-            def task_loading():
-                task()
-                self.program.set_loading(False)
-
-            self.__task_manager.set_task(task_loading, 3)
+            self.__loading_frame_tasks_count += 1
+            self.__task_manager.set_task(partial(self.__run_loading_task, task), 3)
 
         else:
             task()
@@ -1848,7 +2049,20 @@ class Engine:
         Returns: None
         """
         if self.__use_threads:
-            self.__thread_manager.set_thread_task(parallel_task, then, parallel_task_args, then_task_args)
+
+            # Wake up the main loop when the thread ends, so the then task is executed without waiting for the idle
+            # timeout of the loop.
+            # noinspection PyMissingOrEmptyDocstring
+            def parallel_task_and_wake_up(*args):
+                try:
+                    return parallel_task(*args)
+                finally:
+                    glfw.post_empty_event()
+
+            self.__thread_manager.set_thread_task(parallel_task_and_wake_up,
+                                                  self.__with_redraw(then),
+                                                  parallel_task_args,
+                                                  then_task_args)
         else:
 
             if parallel_task_args is None:
@@ -28,6 +28,7 @@ used for the parallel process must be public (they can not be private, protected
 lambda).
 """
 import queue
+from collections import deque
 from multiprocessing import Process, Queue
 
 
@@ -47,7 +48,15 @@ class ProcessManager:
         """
         Constructor of the class.
         """
-        self.__process_list = []
+        self.__process_list = deque()
+
+    def has_running_processes(self) -> bool:
+        """
+        Check if there are processes whose then function was not executed yet.
+
+        Returns: Boolean indicating if there are processes running.
+        """
+        return bool(self.__process_list)
 
     def true_parallel_task(self, q, function, *args) -> None:
         """
@@ -107,25 +116,26 @@ class ProcessManager:
 
         Returns: None
         """
-        to_delete = []
-        for process in self.__process_list:
+        # Nothing to do on the frames without running processes
+        if not self.__process_list:
+            return
+
+        # Check each one of the processes once, keeping on the list only the ones that did not finish yet
+        process_list = self.__process_list
+        for _ in range(len(process_list)):
+            process = process_list.popleft()
 
             try:
                 ret = process['queue'].get(False)
-                process['process'].join()
-
-                # Execute the then function with the returned argument only if the return value of the
-                # parallel process is not None.
-                if ret is not None:
-                    process['then_function'](ret, *process['then_function_args'])
-                else:
-                    process['then_function'](*process['then_function_args'])
-
-                # Add the process as one to delete.
-                to_delete.append(process)
-
             except queue.Empty:
-                pass
+                process_list.append(process)
+                continue
+
+            process['process'].join()
 
-        for process in to_delete:
-            self.__process_list.remove(process)
+            # Execute the then function with the returned argument only if the return value of the
+            # parallel process is not None.
+            if ret is not None:
+                process['then_function'](ret, *process['then_function_args'])
+            else:
+                process['then_function'](*process['then_function_args'])
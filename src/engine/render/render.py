@@ -196,3 +196,17 @@ class Render:
         # Once the render is done, buffers are swapped, showing the complete scene.
         glfw.swap_buffers(self.__window)
         glfw.poll_events()
+
+    def wait_events(self, timeout: float) -> None:
+        """
+        Wait for new events to happen on the window without rendering anything.
+
+        The frame showed on the window is kept since the buffers are not swapped. The thread is put to sleep until an
+        event is received or until the timeout ends.
+
+        Args:
+            timeout: Maximum time to wait for new events, in seconds.
+
+        Returns: None
+        """
+        glfw.wait_events_timeout(timeout)
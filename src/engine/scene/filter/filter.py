@@ -33,6 +33,8 @@ class Filter:
     """
     name: str = 'Base Filter'
 
+    __slots__ = ()
+
     def initialize(self, scene: 'Scene') -> None:
         """
         Initialize the parameters of the filter using a specified scene.
@@ -30,6 +30,8 @@ class HeightLessThan(Filter):
     """
     name: str = 'Height <='
 
+    __slots__ = ('__height_limit',)
+
     def __init__(self, height_limit: float):
         super().__init__()
         self.__height_limit = height_limit
@@ -36,6 +36,8 @@ class IsIn(Filter):
     """
     name: str = 'Is in'
 
+    __slots__ = ('__polygon_id', '__polygon_points')
+
     def __init__(self, polygon_id: Union[str, None]):
         """
         Constructor of the class.
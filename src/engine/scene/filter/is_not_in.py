@@ -38,6 +38,8 @@ class IsNotIn(Filter):
 
     name: str = 'Is not in'
 
+    __slots__ = ('__polygon_id', '__polygon_points')
+
     def __init__(self, polygon_id: Union[str, None]):
         """
         Constructor of the class.
@@ -25,31 +25,7 @@ from scipy import interpolate
 from shapely.geometry.polygon import LinearRing as LinearRing, Polygon
 from shapely.vectorized import contains
 
-
-def delete_z_axis(list_of_points: List[float]) -> list:
-    """
-    Delete the third component of a list of points, returning a list only with the first two components of
-    each point.
-
-    input: [a.x,a.y,a.z,b.x,b.y,b.z,c.x,...]
-    output: [[a.x,a.y],[b.x,b.y],[c.x,...]
-
-    Args:
-        list_of_points: List of points to use
-
-    Returns: List with the points without the third component
-    """
-    new_list = []
-    pair_used = []
-    for component_ind in range(len(list_of_points)):
-        if component_ind % 3 == 0:
-            pair_used.append(list_of_points[component_ind])
-        elif component_ind % 3 == 1:
-            pair_used.append(list_of_points[component_ind])
-        elif component_ind % 3 == 2:
-            new_list.append(pair_used)
-            pair_used = []
-    return new_list
+from src.utils import delete_z_axis
 
 
 def get_bounding_box_indexes(points_array: np.ndarray, polygon: LinearRing) -> list[int]:
@@ -90,10 +66,7 @@ def generate_mask(points_array: np.ndarray, polygon_points) -> np.ndarray:
     """
 
     # generate the polygon
-    points_xy = []
-    for point_ind in range(len(polygon_points)):
-        if point_ind % 3 == 0:
-            points_xy.append((polygon_points[point_ind], polygon_points[point_ind + 1]))
+    points_xy = list(zip(polygon_points[0::3], polygon_points[1::3]))
 
     flags = contains(Polygon(points_xy), points_array[:, :, 0], points_array[:, :, 1])
     return flags
@@ -125,7 +98,8 @@ def merge_matrices(first_matrix: np.ndarray, second_matrix: np.ndarray) -> np.nd
 
 def get_max_min_inside_polygon(points_array: np.ndarray,
                                polygon_points: List[float],
-                               heights: np.ndarray) -> tuple:
+                               heights: np.ndarray,
+                               polygon_mask: tuple = None) -> tuple:
     """
     Extract the maximum and minimum value of the points that are inside the polygon.
 
@@ -135,29 +109,56 @@ def get_max_min_inside_polygon(points_array: np.ndarray,
         points_array: Points of the model. (shape must be (x, y, 3))
         polygon_points: List with the points of the polygon. [x1, y1, z1, x2, y2, z2, ...]
         heights: height: Array with the height of the points. must have shape (x, y)
+        polygon_mask: Value returned by get_polygon_mask for the same points and polygon. Generated if not given.
 
     Returns: Tuple with the maximum and minimum value (max, min).
     """
-    points_no_z_axis = delete_z_axis(polygon_points)
-    closed_polygon = LinearRing(points_no_z_axis)
-    [min_x_index, max_x_index, min_y_index, max_y_index] = get_bounding_box_indexes(points_array,
-                                                                                    closed_polygon)
+    if polygon_mask is None:
+        polygon_mask = get_polygon_mask(points_array, polygon_points)
 
-    points_array_cut = points_array[min_y_index:max_y_index, min_x_index:max_x_index, :]
+    [min_x_index, max_x_index, min_y_index, max_y_index], flags = polygon_mask
     heights_cut = heights[min_y_index:max_y_index, min_x_index:max_x_index]
 
-    flags = generate_mask(points_array_cut, polygon_points)
-
-    # return nan if no points are inside the polygon
-    if len(heights_cut.reshape(-1)) == 0:
+    # return nan if no points are inside the polygon, even if there are points inside its bounding box
+    if heights_cut.size == 0 or not np.any(flags):
         return np.nan, np.nan
 
-    maximum = np.nanmax(heights_cut[flags])
-    minimum = np.nanmin(heights_cut[flags])
+    # Select the heights inside the polygon only once for both values
+    heights_inside = heights_cut[flags]
+    maximum = np.nanmax(heights_inside)
+    minimum = np.nanmin(heights_inside)
 
     return maximum, minimum
 
 
+def get_polygon_mask(points_array: np.ndarray, polygon_points: List[float]) -> (list, np.ndarray):
+    """
+    Get the bounding box of the polygon in the points array and the mask of the points of the bounding box that are
+    inside the polygon.
+
+    The mask only depends on the coordinates of the points and the polygon, so it can be reused while the polygon is
+    not modified even if the heights of the points change.
+
+    Args:
+        points_array: Points of the model. (shape must be (x, y, 3))
+        polygon_points: List with the points of the polygon. [x1, y1, z1, x2, y2, z2, ...]
+
+    Returns: Tuple with the indices of the bounding box [min_x, max_x, min_y, max_y] and the mask of its points.
+    """
+    points_no_z_axis = delete_z_axis(polygon_points)
+    closed_polygon = LinearRing(points_no_z_axis)
+    bounding_box_indexes = get_bounding_box_indexes(points_array, closed_polygon)
+    [min_x_index, max_x_index, min_y_index, max_y_index] = bounding_box_indexes
+
+    points_array_cut = points_array[min_y_index:max_y_index, min_x_index:max_x_index, :]
+
+    # No points to check if the polygon is outside the points
+    if points_array_cut.size == 0:
+        return bounding_box_indexes, np.zeros(points_array_cut.shape[:2], dtype=bool)
+
+    return bounding_box_indexes, generate_mask(points_array_cut, polygon_points)
+
+
 def get_external_polygon_points(polygon_points: List[float],
                                 distance: float,
                                 default_z_value: float = 0.5) -> List[float]:
@@ -206,51 +207,36 @@ def interpolate_nan(array_2d: np.ndarray,
 
     Returns: Array interpolated.
     """
-    # noinspection PyShadowingNames
-    grid_x, grid_y = np.mgrid[:array_2d.shape[0], :array_2d.shape[1]]
-    data = np.zeros((array_2d.shape[0], array_2d.shape[1], 3))
-    data[:, :, 0] = grid_x
-    data[:, :, 1] = grid_y
-    data[:, :, 2] = array_2d
-
-    # Change shape of the data to an array of points
-    # ----------------------------------------------
-    nan_mask = nan_mask.reshape(-1)
-    data = data.reshape((-1, 3))
-
     # Select only points that have values and have a nan neighbour
     # ------------------------------------------------------------
     original_data = np.isnan(array_2d)
-    shift_up = np.isnan(np.roll(array_2d, 1, axis=0))
-    shift_down = np.isnan(np.roll(array_2d, -1, axis=0))
-    shift_left = np.isnan(np.roll(array_2d, -1, axis=1))
-    shift_right = np.isnan(np.roll(array_2d, 1, axis=1))
+    shift_up = np.roll(original_data, 1, axis=0)
+    shift_down = np.roll(original_data, -1, axis=0)
+    shift_left = np.roll(original_data, -1, axis=1)
+    shift_right = np.roll(original_data, 1, axis=1)
     pivots_points = ~original_data & (shift_up | shift_down | shift_left | shift_right)
-    pivot_points_1d = pivots_points.reshape(-1)
-
-    # Select the points and their value to use as values for the interpolation
-    # ------------------------------------------------------------------------
-    points = data[pivot_points_1d][:, 0:2]
-    values = data[pivot_points_1d][:, 2]
 
-    points_to_interpolate = data[nan_mask][:, 0:2]
-    if len(points_to_interpolate) == 0:
+    # Get the indices of the points to interpolate and of the points to use as values for the interpolation, the
+    # indices are used directly as the coordinates of the points
+    # ----------------------------------------------------------------------------------------------------------
+    interpolate_rows, interpolate_columns = np.nonzero(nan_mask.reshape(array_2d.shape))
+    if len(interpolate_rows) == 0:
         return array_2d  # Do nothing if there is no points to interpolate
 
-    if len(points) == 0:
+    pivot_rows, pivot_columns = np.nonzero(pivots_points)
+    if len(pivot_rows) == 0:
         return array_2d  # Do nothing if there is no points to use as pivot
 
-    # Interpolate values
-    # ------------------
-    # noinspection PyShadowingNames
-    y = interpolate.griddata(points, values, points_to_interpolate, method=interpolation_type)
-
-    # Modify the values of the data
-    # -----------------------------
-    data_nan_mask = data[nan_mask]
-    data_nan_mask[:, 2] = y
-    data[nan_mask] = data_nan_mask
-    data = data[:, 2]
-    data = data.reshape(array_2d.shape)
+    data = np.array(array_2d, dtype=float)
+    points = np.column_stack((pivot_rows, pivot_columns))
+    values = data[pivot_rows, pivot_columns]
+    points_to_interpolate = np.column_stack((interpolate_rows, interpolate_columns))
+
+    # Interpolate values and modify the values of the data
+    # ----------------------------------------------------
+    data[interpolate_rows, interpolate_columns] = interpolate.griddata(points,
+                                                                       values,
+                                                                       points_to_interpolate,
+                                                                       method=interpolation_type)
 
     return data
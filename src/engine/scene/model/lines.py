@@ -64,23 +64,24 @@ class Lines(Model):
 
         # initialize model if data is given
         if point_list is not None:
-            points_copy = point_list.copy()
 
             # Check points
             # ------------
-            number_points = len(points_copy)
+            number_points = len(point_list)
             assert number_points > 0, 'Trying to load points with an array with no data.'
 
             # Set the points
             # --------------
-            points_copy = np.repeat(points_copy, 2, axis=0)[1:-1]
-            self.__point_list = list(points_copy.reshape(-1))
-            self.set_vertices(np.array(self.__point_list, dtype=np.float32))
+            # The vertices are uploaded directly from the array, without converting every coordinate to a python object
+            point_array = np.repeat(point_list, 2, axis=0)[1:-1].reshape(-1)
+            self.__point_list = point_array.tolist()
+            self.set_vertices(point_array.astype(np.float32))
 
             # Set the indices
             # ---------------
-            self.__indices_list = list(np.arange(0, (number_points - 1) * 2))
-            self.set_indices(np.array(self.__indices_list, dtype=np.uint32))
+            indices_array = np.arange(0, (number_points - 1) * 2, dtype=np.uint32)
+            self.__indices_list = indices_array.tolist()
+            self.set_indices(indices_array)
 
     def _update_uniforms(self) -> None:
         """
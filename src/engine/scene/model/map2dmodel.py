@@ -54,6 +54,12 @@ class Map2DModel(MapModel):
         self.__colors = []
         self.__height_limit = []
 
+        # Uniforms keep their values in the shader program, so the colors are only sent when they change. The
+        # locations of the uniforms are stored with the program used to get them.
+        self.__color_uniforms_updated = False
+        self.__uniform_locations = {}
+        self.__uniform_locations_program = None
+
         # Grid variables
         # --------------
         self.__x = None  # Values used for the x-axis of the model
@@ -122,7 +128,7 @@ class Map2DModel(MapModel):
         log.debug('Converting array to list')
         to_delete = inside
 
-        log.debug(f"Triangles to delete added: {len(to_delete)}")
+        log.debug("Triangles to delete added: %s", len(to_delete))
 
         # Add triangles to delete to the list of the model
         # ------------------------------------------------
@@ -293,21 +299,24 @@ class Map2DModel(MapModel):
         Set the maximum and minimum height of the vertices.
         Returns: None
         """
-        # get the location
-        projection_location = GL.glGetUniformLocation(self.shader_program, "projection")
+        # get the location, only when the shaders changed
+        if self.__uniform_locations_program != self.shader_program:
+            self.__uniform_locations = {name: GL.glGetUniformLocation(self.shader_program, name)
+                                        for name in ('projection', 'colors', 'height_color', 'length')}
+            self.__uniform_locations_program = self.shader_program
+            self.__color_uniforms_updated = False
 
-        # set the value
-        GL.glUniformMatrix4fv(projection_location, 1, GL.GL_TRUE, self.scene.get_projection_matrix_2D())
+        uniform_locations = self.__uniform_locations
 
-        # set colors if using
-        if self.__color_file is not None:
-            colors_location = GL.glGetUniformLocation(self.shader_program, "colors")
-            height_color_location = GL.glGetUniformLocation(self.shader_program, "height_color")
-            length_location = GL.glGetUniformLocation(self.shader_program, "length")
+        # set the value
+        GL.glUniformMatrix4fv(uniform_locations['projection'], 1, GL.GL_TRUE, self.scene.get_projection_matrix_2D())
 
-            GL.glUniform3fv(colors_location, len(self.__colors), self.__colors)
-            GL.glUniform1fv(height_color_location, len(self.__height_limit), self.__height_limit)
-            GL.glUniform1i(length_location, len(self.__colors))
+        # set colors if using and if they changed since the last time they were set
+        if self.__color_file is not None and not self.__color_uniforms_updated:
+            GL.glUniform3fv(uniform_locations['colors'], len(self.__colors), self.__colors)
+            GL.glUniform1fv(uniform_locations['height_color'], len(self.__height_limit), self.__height_limit)
+            GL.glUniform1i(uniform_locations['length'], len(self.__colors))
+            self.__color_uniforms_updated = True
 
     def get_color_file(self) -> str:
         """
@@ -387,9 +396,11 @@ class Map2DModel(MapModel):
 
         The returned arrays can be empty if the model is not initialized with data yet.
 
+        The returned arrays are not a copy of the arrays used in the model, so they must not be modified.
+
         Returns: (x-axis, y-axis) tuple with the data of the coordinates of the model.
         """
-        return np.array(self.__x), np.array(self.__y)
+        return np.asarray(self.__x), np.asarray(self.__y)
 
     def get_name(self) -> Union[str, None]:
         """
@@ -422,15 +433,22 @@ class Map2DModel(MapModel):
         """
         log.debug("Optimizing gpu memory of the model deleting triangles")
 
+        # Nothing to delete since the last optimization, the indices on the GPU are already optimal
+        if len(self.__triangles_to_delete) == 0:
+            log.debug("No triangles to delete")
+            then()
+            return
+
         # noinspection PyMissingOrEmptyDocstring
         def parallel_routine():
             # Delete the triangles from the list
+            # np.unique works over the array without creating python objects for every triangle, so the main thread
+            # is not blocked while the repeated triangles are deleted.
             log.debug("Deleting repeated triangles")
-            self.__triangles_to_delete = list(set(self.__triangles_to_delete))
+            triangles_array = np.unique(self.__triangles_to_delete)
 
             log.debug("Generating list of indices")
 
-            triangles_array = np.array(self.__triangles_to_delete)
             vertex_1 = triangles_array * 3
             vertex_2 = triangles_array * 3 + 1
             vertex_3 = triangles_array * 3 + 2
@@ -494,6 +512,7 @@ class Map2DModel(MapModel):
 
         self.__colors = np.array(colors, dtype=np.float32)
         self.__height_limit = np.array(height_limit, dtype=np.float32)
+        self.__color_uniforms_updated = False
 
     def set_vertices_from_grid_async(self, x, y, z, quality=1, then=lambda: None) -> None:
         """
@@ -587,10 +606,10 @@ class Map2DModel(MapModel):
             bottom_coordinate = showed_limits['bottom']
 
             log.debug("Coordinates actually showing on the screen:")
-            log.debug(f"left: {left_coordinate}")
-            log.debug(f"right: {right_coordinate}")
-            log.debug(f"top:{top_coordinate} ")
-            log.debug(f"bottom: {bottom_coordinate}")
+            log.debug("left: %s", left_coordinate)
+            log.debug("right: %s", right_coordinate)
+            log.debug("top:%s ", top_coordinate)
+            log.debug("bottom: %s", bottom_coordinate)
 
             # Calculate the definition to use in the reload
             # ---------------------------------------------
@@ -599,15 +618,15 @@ class Map2DModel(MapModel):
             elements_on_screen_y = abs(self.__get_index_closest_value(self.__y, top_coordinate) -
                                        self.__get_index_closest_value(self.__y, bottom_coordinate))
 
-            log.debug(f"Number of vertices on screen axis X: {elements_on_screen_x}")
-            log.debug(f"Number of vertices on screen axis Y: {elements_on_screen_y}")
+            log.debug("Number of vertices on screen axis X: %s", elements_on_screen_x)
+            log.debug("Number of vertices on screen axis Y: %s", elements_on_screen_y)
 
             scene_data = self.scene.get_scene_setting_data()
             step_x = int(elements_on_screen_x / scene_data['SCENE_WIDTH_X'])  # + 2
             step_y = int(elements_on_screen_y / scene_data['SCENE_HEIGHT_Y'])  # + 2
 
-            log.debug(f"Step used to generate index list on x axis {step_x}")
-            log.debug(f"Step used to generate index list on y axis {step_y}")
+            log.debug("Step used to generate index list on x axis %s", step_x)
+            log.debug("Step used to generate index list on y axis %s", step_y)
 
             # Generate new list of triangles to add to the model
             # --------------------------------------------------
@@ -60,6 +60,12 @@ class Map3DModel(MapModel):
         self.__colors = []
         self.__height_color_limits = []
 
+        # Uniforms keep their values in the shader program, so the colors are only sent when they change. The
+        # locations of the uniforms are stored with the program used to get them.
+        self.__color_uniforms_updated = False
+        self.__uniform_locations = {}
+        self.__uniform_locations_program = None
+
         # Vertices variables
         # ------------------
         self.__vertices_measure_unit = vertices_measure_unit
@@ -134,24 +140,27 @@ class Map3DModel(MapModel):
 
         Returns: None
         """
-        model_location = GL.glGetUniformLocation(self.shader_program, "model")
-        view_location = GL.glGetUniformLocation(self.shader_program, "view")
-        projection_location = GL.glGetUniformLocation(self.shader_program, "projection")
-
-        # set the value
-        GL.glUniformMatrix4fv(model_location, 1, GL.GL_TRUE, self.__model)
-        GL.glUniformMatrix4fv(view_location, 1, GL.GL_TRUE, self.scene.get_camera_view_matrix())
-        GL.glUniformMatrix4fv(projection_location, 1, GL.GL_TRUE, self.scene.get_projection_matrix_3D())
+        # get the locations, only when the shaders changed
+        if self.__uniform_locations_program != self.shader_program:
+            self.__uniform_locations = {name: GL.glGetUniformLocation(self.shader_program, name)
+                                        for name in ('model', 'view', 'projection', 'colors', 'height_color', 'length')}
+            self.__uniform_locations_program = self.shader_program
+            self.__color_uniforms_updated = False
 
-        # set colors if using
-        if self.__color_file is not None:
-            colors_location = GL.glGetUniformLocation(self.shader_program, "colors")
-            height_color_location = GL.glGetUniformLocation(self.shader_program, "height_color")
-            length_location = GL.glGetUniformLocation(self.shader_program, "length")
+        uniform_locations = self.__uniform_locations
 
-            GL.glUniform3fv(colors_location, len(self.__colors), self.__colors)
-            GL.glUniform1fv(height_color_location, len(self.__height_color_limits), self.__height_color_limits)
-            GL.glUniform1i(length_location, len(self.__colors))
+        # set the value
+        GL.glUniformMatrix4fv(uniform_locations['model'], 1, GL.GL_TRUE, self.__model)
+        GL.glUniformMatrix4fv(uniform_locations['view'], 1, GL.GL_TRUE, self.scene.get_camera_view_matrix())
+        GL.glUniformMatrix4fv(uniform_locations['projection'], 1, GL.GL_TRUE, self.scene.get_projection_matrix_3D())
+
+        # set colors if using and if they changed since the last time they were set
+        if self.__color_file is not None and not self.__color_uniforms_updated:
+            GL.glUniform3fv(uniform_locations['colors'], len(self.__colors), self.__colors)
+            GL.glUniform1fv(uniform_locations['height_color'], len(self.__height_color_limits),
+                            self.__height_color_limits)
+            GL.glUniform1i(uniform_locations['length'], len(self.__colors))
+            self.__color_uniforms_updated = True
 
     def change_height_measure_unit(self, new_measure_unit: str) -> None:
         """
@@ -249,6 +258,7 @@ class Map3DModel(MapModel):
 
         self.__colors = np.array(colors, dtype=np.float32)
         self.__height_color_limits = np.array(height_limit, dtype=np.float32)
+        self.__color_uniforms_updated = False
 
     def update_values_from_2D_model(self) -> None:
         """
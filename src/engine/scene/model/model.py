@@ -135,7 +135,7 @@ class Model:
         GL.glBufferData(
             GL.GL_ELEMENT_ARRAY_BUFFER,
             len(indices) * self.scene.get_float_bytes(),
-            indices.astype(np.uint32),
+            indices.astype(np.uint32, copy=False),
             GL.GL_STATIC_DRAW,
         )
 
@@ -163,6 +163,9 @@ class Model:
     def set_vertices(self, vertex: np.ndarray) -> None:
         """Set the vertices buffers inside the model.
 
+        The vertices are only converted to float32 when they use another type, since that is the type used by the
+        buffers of the GPU.
+
         Args:
             vertex: List of vertices of type np.float32.
         """
@@ -171,7 +174,7 @@ class Model:
         GL.glBufferData(
             GL.GL_ARRAY_BUFFER,
             len(vertex) * self.scene.get_float_bytes(),
-            vertex.astype(np.float32),
+            vertex.astype(np.float32, copy=False),
             GL.GL_STATIC_DRAW,
         )
 
@@ -71,14 +71,15 @@ class Points(Model):
         # Initialize model if data is given
         # ---------------------------------
         if point_list is not None:
-            point_list_copy = point_list.copy()
 
             # Set points
             # ----------
-            self.__point_list = list(point_list.reshape(-1))
-            self.set_vertices(np.array(self.__point_list, dtype=np.float32))
+            # The vertices are uploaded directly from the array, without converting every coordinate to a python object
+            point_array = point_list.reshape(-1)
+            self.__point_list = point_array.tolist()
+            self.set_vertices(point_array.astype(np.float32))
 
-            point_number = len(point_list_copy)
+            point_number = len(point_list)
             assert point_number > 0, 'Trying to load points with an array with no data.'
 
             # Set colors
@@ -95,7 +96,7 @@ class Points(Model):
             # Set indices
             # -----------
             self.__indices_list = list(range(point_number))
-            self.set_indices(np.array(self.__indices_list, dtype=np.uint32))
+            self.set_indices(np.arange(point_number, dtype=np.uint32))
 
     def __add_color_to_color_list(self, color: tuple) -> None:
         """
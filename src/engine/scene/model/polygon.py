@@ -257,6 +257,14 @@ class Polygon(Model):
         """
         return self.__parameters.get(key)
 
+    def get_parameter_dict(self) -> dict:
+        """
+        Return a copy of the parameters of the polygon as a dictionary.
+
+        Returns: Dictionary with the parameters {key: value, ...}
+        """
+        return dict(self.__parameters)
+
     def get_parameter_list(self) -> list:
         """
         Return all the parameters of the polygon as a list.
@@ -319,7 +327,7 @@ class Polygon(Model):
 
         Returns: None
         """
-        log.debug(f"Changing polygon dot color to {color}")
+        log.debug("Changing polygon dot color to %s", color)
         self.__point_model.set_normal_color(tuple(color))
 
     def set_id(self, new_id: str) -> None:
@@ -344,7 +352,7 @@ class Polygon(Model):
 
         Returns: None
         """
-        log.debug(f"Changing polygon color to {color}")
+        log.debug("Changing polygon color to %s", color)
         self.__lines_model.set_line_color(color)
         self.__last_line_model.set_line_color(color)
 
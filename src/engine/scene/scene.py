@@ -28,7 +28,8 @@ import OpenGL.constant as OGLConstant
 import numpy as np
 
 from src.engine.scene.camera import Camera
-from src.engine.scene.geometrical_operations import get_external_polygon_points, get_max_min_inside_polygon
+from src.engine.scene.geometrical_operations import get_external_polygon_points, get_max_min_inside_polygon, \
+    get_polygon_mask
 from src.engine.scene.interpolation.interpolation import Interpolation
 from src.engine.scene.map_transformation.map_transformation import MapTransformation
 from src.engine.scene.model.lines import Lines
@@ -89,6 +90,10 @@ class Scene:
         # be draw.
         self.__model_draw_priority: List[str] = []
 
+        # Masks of the points of the models inside the polygons, stored by model and polygon with the points of the
+        # polygon and the shape of the model used to generate them
+        self.__polygon_mask_cache: Dict[tuple, tuple] = {}
+
         # Variables used by the scene to execute the main logic
         # -----------------------------------------------------
         self.__engine = engine
@@ -343,28 +348,33 @@ class Scene:
 
         Returns: Tuple with the maximum and minimum height of the vertices inside the polygon.
         """
-        if model_id not in self.__model_hash:
-            raise SceneError(7)
-        if polygon_id not in self.__polygon_hash:
-            raise SceneError(5)
+        max_min_data = self.get_max_min_height_data(model_id, polygon_id)
+        max_min_values, polygon_mask = self.calculate_max_min_height_from_data(max_min_data)
+        self.set_polygon_mask(model_id, polygon_id, max_min_data['mask_data'], polygon_mask)
+        return max_min_values
 
-        # get the important information.
-        model = self.__model_hash[model_id]
-        polygon = self.__polygon_hash[polygon_id]
+    @staticmethod
+    def calculate_max_min_height_from_data(max_min_data: dict) -> (tuple, tuple):
+        """
+        Calculate the maximum and minimum height of the vertices that are inside a polygon using the data returned by
+        get_max_min_height_data.
 
-        # ask the model and polygon for the parameters to calculate the new height
-        vertices_shape = model.get_vertices_shape()
-        vertex_array = model.get_vertices_array().reshape(vertices_shape)
-        height_array = model.get_height_array()
-        polygon_points = polygon.get_point_list()
+        The method does not use the scene, so it can be executed in another thread.
 
-        if len(polygon_points) < 9:
-            raise SceneError(2)
+        Args:
+            max_min_data: Data returned by get_max_min_height_data.
 
-        if not polygon.is_planar():
-            raise SceneError(1)
+        Returns: Tuple with the maximum and minimum height and the mask of the vertices inside the polygon.
+        """
+        polygon_mask = max_min_data['polygon_mask']
+        if polygon_mask is None:
+            polygon_mask = get_polygon_mask(max_min_data['vertices'], max_min_data['polygon_points'])
 
-        return get_max_min_inside_polygon(vertex_array, polygon_points, height_array)
+        max_min_values = get_max_min_inside_polygon(max_min_data['vertices'],
+                                                    max_min_data['polygon_points'],
+                                                    max_min_data['heights'],
+                                                    polygon_mask)
+        return max_min_values, polygon_mask
 
     def change_camera_azimuthal_angle(self, angle):
         """
@@ -587,18 +597,18 @@ class Scene:
             shape = active_model_information['height_array'].shape
 
             if x_array.shape != X.shape or not np.isclose(x_array, X).all():
-                log.debug(f"Current model X axis: {x_array}")
-                log.debug(f"New model X axis: {X}")
+                log.debug("Current model X axis: %s", x_array)
+                log.debug("New model X axis: %s", X)
                 raise SceneError(9, {'expected': x_array, 'actual': X})
 
             if y_array.shape != Y.shape or not np.isclose(y_array, Y).all():
-                log.debug(f"Current model Y axis: {y_array}")
-                log.debug(f"New model Y axis: {Y}")
+                log.debug("Current model Y axis: %s", y_array)
+                log.debug("New model Y axis: %s", Y)
                 raise SceneError(10, {'expected': y_array, 'actual': Y})
 
             if shape != Z.shape:
-                log.debug(f"Model current shape: {shape}")
-                log.debug(f"New model shape: {Z.shape}")
+                log.debug("Model current shape: %s", shape)
+                log.debug("New model shape: %s", Z.shape)
                 raise SceneError(11, {'expected': shape, 'actual': Z.shape})
 
         # Generate the model and add it to the scene
@@ -691,6 +701,10 @@ class Scene:
         if polygon_id in self.__polygon_hash:
             self.__polygon_hash.pop(polygon_id)
 
+        # remove the masks generated with the polygon
+        for key in [key for key in self.__polygon_mask_cache if key[1] == polygon_id]:
+            self.__polygon_mask_cache.pop(key)
+
         # remove the interpolation area if they have
         if polygon_id in self.__interpolation_area_hash:
             self.__interpolation_area_hash.pop(polygon_id)
@@ -767,7 +781,8 @@ class Scene:
 
         Returns: Dictionary with the limits showing on the scene
         """
-        if self.__left_coordinate is None or \
+        if self.__projection_matrix_2D is None or \
+                self.__left_coordinate is None or \
                 self.__right_coordinate is None or \
                 self.__top_coordinate is None or \
                 self.__bottom_coordinate is None:
@@ -866,6 +881,54 @@ class Scene:
         vertices_array = model.get_vertices_array().reshape(model.get_vertices_shape())
         return vertices_array
 
+    def get_max_min_height_data(self, model_id: str, polygon_id: str) -> dict:
+        """
+        Get a copy of the data needed to calculate the maximum and minimum height of the vertices inside a polygon.
+
+        The data returned does not share memory with the models and polygons of the scene, so it can be used from
+        another thread while the scene is modified. The vertices are only copied if the mask of the vertices inside
+        the polygon is not cached, since they are only used to generate the mask.
+
+        Args:
+            model_id: ID of the model to use.
+            polygon_id: ID of the polygon to use.
+
+        Returns: Dictionary with the vertices, heights, polygon points, cached mask and data used to generate the mask.
+        """
+        if model_id not in self.__model_hash:
+            raise SceneError(7)
+        if polygon_id not in self.__polygon_hash:
+            raise SceneError(5)
+
+        # get the important information.
+        model = self.__model_hash[model_id]
+        polygon = self.__polygon_hash[polygon_id]
+        polygon_points = list(polygon.get_point_list())
+
+        if len(polygon_points) < 9:
+            raise SceneError(2)
+
+        if not polygon.is_planar():
+            raise SceneError(1)
+
+        # The mask does not depend on the heights, so it is only generated again if the polygon changed
+        vertices_shape = model.get_vertices_shape()
+        mask_data = (tuple(polygon_points), vertices_shape)
+        cached_mask_data, polygon_mask = self.__polygon_mask_cache.get((model_id, polygon_id), (None, None))
+
+        vertices = None
+        if cached_mask_data != mask_data:
+            polygon_mask = None
+            vertices = model.get_vertices_array().reshape(vertices_shape).copy()
+
+        return {
+            'vertices': vertices,
+            'heights': model.get_height_array().copy(),
+            'polygon_points': polygon_points,
+            'polygon_mask': polygon_mask,
+            'mask_data': mask_data
+        }
+
     def get_model_coordinates_arrays(self, model_id: str) -> (Union[np.ndarray, None], Union[np.ndarray, None]):
         """
         Get two arrays, the first containing the coordinates used in the model for the x-axis and the second
@@ -944,6 +1007,18 @@ class Scene:
         """
         return list(self.__model_hash.keys())
 
+    def get_model_name(self, model_id: str) -> Union[str, None]:
+        """
+        Get the name of a model given its id.
+
+        Args:
+            model_id: Id of the model.
+
+        Returns: Name of the model.
+        """
+        if model_id in self.__model_hash:
+            return self.__model_hash[model_id].get_name()
+
     def get_point_list_from_polygon(self, polygon_id: str) -> list:
         """
         Return the list of points from a given polygon.
@@ -959,6 +1034,25 @@ class Scene:
             # noinspection PyTypeChecker
             raise SceneError(5)
 
+    def get_polygon_export_data(self, polygon_id_list: List[str]) -> (List[list], List[dict], List[str]):
+        """
+        Get the points, the parameters and the names of a list of polygons, in the same order as the ids.
+
+        Args:
+            polygon_id_list: List with the IDs of the polygons.
+
+        Returns: Tuple with the list of points, the list of parameters and the list of names of the polygons.
+        """
+        try:
+            polygons = [self.__polygon_hash[polygon_id] for polygon_id in polygon_id_list]
+        except KeyError:
+            # noinspection PyTypeChecker
+            raise SceneError(5)
+
+        return ([polygon.get_point_list() for polygon in polygons],
+                [polygon.get_parameter_dict() for polygon in polygons],
+                [polygon.get_name() for polygon in polygons])
+
     def get_polygon_id_list(self) -> list:
         """
         Return a list with the ids of the polygons being used in the program.
@@ -1243,7 +1337,7 @@ class Scene:
         if polygon_id is None:
             raise AssertionError('There is no active polygon.')
 
-        log.debug(f'Removing last point from polygon {polygon_id}')
+        log.debug('Removing last point from polygon %s', polygon_id)
         if polygon_id in self.__polygon_hash:
             self.__polygon_hash[polygon_id].remove_last_added_point()
             return
@@ -1254,29 +1348,22 @@ class Scene:
         """
         Remove the model with the specified id.
 
+        Both the 2D and the 3D representation of the model are removed, along with the data cached for the model.
+        Do nothing if the model does not exists.
+
         Args:
             id_model: Id of the model to remove.
 
         Returns: None
         """
-        if id_model in self.__model_hash:
-            self.__model_hash.pop(id_model)
+        self.__model_hash.pop(id_model, None)
+        self.__3d_model_hash.pop(id_model, None)
         if id_model in self.__model_draw_priority:
             self.__model_draw_priority.remove(id_model)
 
-    def remove_model_3d(self, id_model: str) -> None:
-        """
-        Remove the 3D model with the specified id.
-
-        Do nothing if the model does not exists.
-
-        Args:
-            id_model: ID of the model to remove.
-
-        Returns: None
-        """
-        if id_model in self.__3d_model_hash:
-            self.__3d_model_hash.pop(id_model)
+        # remove the masks generated with the model
+        for key in [key for key in self.__polygon_mask_cache if key[0] == id_model]:
+            self.__polygon_mask_cache.pop(key)
 
     def reset_camera_values(self) -> None:
         """
@@ -1306,6 +1393,24 @@ class Scene:
         for model in self.__3d_model_hash.values():
             model.polygon_mode = polygon_mode
 
+    def set_polygon_mask(self, model_id: str, polygon_id: str, mask_data: tuple, polygon_mask: tuple) -> None:
+        """
+        Store the mask of the vertices of a model inside a polygon to reuse it while the polygon does not change.
+
+        Must be called from the main thread. The mask is not stored if the model or the polygon were removed while
+        the mask was being generated.
+
+        Args:
+            model_id: ID of the model used to generate the mask.
+            polygon_id: ID of the polygon used to generate the mask.
+            mask_data: Points of the polygon and shape of the vertices of the model used to generate the mask.
+            polygon_mask: Mask generated.
+
+        Returns: None
+        """
+        if model_id in self.__model_hash and polygon_id in self.__polygon_hash:
+            self.__polygon_mask_cache[(model_id, polygon_id)] = (mask_data, polygon_mask)
+
     def set_polygon_name(self, polygon_id: str, new_name: str) -> None:
         """
         Change the name of a polygon.
@@ -1370,6 +1475,17 @@ class Scene:
         for model in self.__model_hash.values():
             model.set_color_file(color_file)
 
+    def invalidate_projection_matrix_2D(self) -> None:
+        """
+        Mark the projection matrix used by the 2D models as outdated.
+
+        The matrix and the limits showed on the screen are generated again the next time that they are used, so many
+        changes done between two frames (zoom, movement of the map) only generate the matrix once.
+
+        Returns: None
+        """
+        self.__projection_matrix_2D = None
+
     def update_projection_matrix_2D(self) -> None:
         """
         Generate the projection matrix on the model. Method must be called before drawing.
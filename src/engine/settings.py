@@ -57,6 +57,7 @@ class Settings:
     ACTIVE_POLYGON_LINE_WIDTH = POLYGON_LINE_WIDTH * 2
     DOT_SIZE = 1
     POLYGON_DOT_SIZE = 10
+    IDLE_WAIT_TIMEOUT = 0.2  # seconds to wait for new events when nothing needs to be redrawn
 
     # SCENE settings
     SCENE_BEGIN_X = LEFT_FRAME_WIDTH
@@ -67,10 +68,32 @@ class Settings:
 
     # GUI settings
     FIXED_FRAMES = True
+    REDRAW_FRAMES = 3  # frames to redraw after an event so imgui can update the state of the widgets
 
     # Type settings
     FLOAT_BYTES = 4  # float will be represented by 4 bytes.
 
+    # Version of the settings, changes every time that the settings are modified
+    VERSION = 0
+
+    @staticmethod
+    def change_window_size(width: int, height: int) -> None:
+        """
+        Change the size of the window and update the settings related to the scene with it.
+
+        All the values are changed before updating the version of the settings, so the data generated from the
+        settings always uses the width and the height of the same size of the window.
+
+        Args:
+            width: New width of the window.
+            height: New height of the window.
+
+        Returns: None
+        """
+        Settings.WIDTH = width
+        Settings.HEIGHT = height
+        Settings.update_scene_values()
+
     @staticmethod
     def fix_frames(fix_frames: bool) -> None:
         """
@@ -84,6 +107,18 @@ class Settings:
         Settings.FIXED_FRAMES = fix_frames
         Settings.update_scene_values()
 
+    @staticmethod
+    def update_version() -> None:
+        """
+        Change the version of the settings.
+
+        Must be called every time that a setting is modified so the components that store data generated from the
+        settings know that they must generate it again.
+
+        Returns: None
+        """
+        Settings.VERSION += 1
+
     @staticmethod
     def update_scene_values() -> None:
         """
@@ -104,3 +139,5 @@ class Settings:
             Settings.SCENE_BEGIN_Y = 0
             Settings.SCENE_WIDTH_X = Settings.WIDTH
             Settings.SCENE_HEIGHT_Y = Settings.HEIGHT - Settings.MAIN_MENU_BAR_HEIGHT
+
+        Settings.update_version()
@@ -38,7 +38,17 @@ class TaskManager:
         """
         Constructor of the class.
         """
+        # Tasks and the number of frames left for each one of them, stored in parallel lists
         self.__pending_task_list = []
+        self.__pending_frames_list = []
+
+    def has_pending_tasks(self) -> bool:
+        """
+        Check if there are tasks waiting to be executed.
+
+        Returns: Boolean indicating if there are tasks waiting to be executed.
+        """
+        return bool(self.__pending_task_list)
 
     def set_task(self, task: callable, n_frames: int = 2) -> None:
         """
@@ -54,10 +64,8 @@ class TaskManager:
         """
         assert n_frames > 0
 
-        self.__pending_task_list.append({
-            'task': task,
-            'frames': n_frames  # need to be 2 to really wait one full frame
-        })
+        self.__pending_task_list.append(task)
+        self.__pending_frames_list.append(n_frames)  # need to be 2 to really wait one full frame
 
     def update_tasks(self) -> None:
         """
@@ -66,21 +74,44 @@ class TaskManager:
         This method updates the variables that count the frames of the active tasks that are present in the program
         in a given time.
 
+        If one of the tasks raises an error, the error is raised again after keeping the rest of the pending tasks.
+
         Returns: None
         """
-        to_delete = []
+        # Nothing to do on the frames without pending tasks
+        if not self.__pending_task_list:
+            return
 
-        # Check on the tasks
-        for task in self.__pending_task_list:
-
-            # Subtract one frame from the task
-            task['frames'] -= 1
-
-            # Execute it if frames to wait is zero
-            if task['frames'] == 0:
-                task['task']()
-                to_delete.append(task)
+        # Tasks set while executing the tasks are stored in a new list and updated from the next frame
+        task_list = self.__pending_task_list
+        frames_list = self.__pending_frames_list
+        self.__pending_task_list = []
+        self.__pending_frames_list = []
+        remaining_task_list = []
+        remaining_frames_list = []
 
-        # Delete tasks already executed
-        for task in to_delete:
-            self.__pending_task_list.remove(task)
+        # Check on the tasks
+        processed_tasks = 0
+        try:
+            for task, frames in zip(task_list, frames_list):
+                processed_tasks += 1
+
+                # Subtract one frame from the task
+                frames -= 1
+
+                # Execute it if frames to wait is zero, keep it otherwise
+                if frames == 0:
+                    task()
+                else:
+                    remaining_task_list.append(task)
+                    remaining_frames_list.append(frames)
+
+        finally:
+            # Keep the tasks not checked yet if one of the tasks raised an error
+            remaining_task_list.extend(task_list[processed_tasks:])
+            remaining_frames_list.extend(frames_list[processed_tasks:])
+
+            remaining_task_list.extend(self.__pending_task_list)
+            remaining_frames_list.extend(self.__pending_frames_list)
+            self.__pending_task_list = remaining_task_list
+            self.__pending_frames_list = remaining_frames_list
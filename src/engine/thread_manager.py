@@ -21,19 +21,31 @@ File with the class ThreadManager, class in charge of the management of the thre
 Threads must be update regularly so the function programmed as then should be called. Otherwise, even if the logic
 programmed in the thread ends, the then function will not be called.
 """
-from threading import Thread
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
 
 
 class ThreadManager:
     """
     Class in charge of the management of the threads on the program.
+
+    Threads notify their end by adding the then function to a queue, so the manager does not need to check the state
+    of every running thread on each update.
+
+    The tasks are executed in a pool of threads created once by the manager, instead of creating a new thread for
+    every task.
     """
 
     def __init__(self):
         """
         Constructor of the class.
         """
-        self.__threads_list = []
+        self.__finished_threads_queue = SimpleQueue()
+
+        # Tasks are mostly numpy work, so there is no gain in having more threads than processors
+        self.__thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='ThreadManager')
 
     def update_threads(self):
         """
@@ -42,19 +54,16 @@ class ThreadManager:
         If the threads ended their execution, then the then_function is called, if they did not end their execution,
         then this method does nothing.
         """
-        to_delete = []
-        for thread_pair in self.__threads_list:
-            if not thread_pair['thread'].is_alive():
-                to_delete.append(thread_pair)
+        # The main thread is the only consumer of the queue, so it can not be emptied between the check and the get
+        finished_threads_queue = self.__finished_threads_queue
+        while not finished_threads_queue.empty():
+            return_value, then_func, then_args = finished_threads_queue.get_nowait()
 
-                # Check if the return object is None or not to give it to the then task
-                if thread_pair['return_array'][0] is not None:
-                    thread_pair['then_func'](thread_pair['return_array'][0], *thread_pair['then_args'])
-                else:
-                    thread_pair['then_func'](*thread_pair['then_args'])
-
-        for thread_ended in to_delete:
-            self.__threads_list.remove(thread_ended)
+            # Check if the return object is None or not to give it to the then task
+            if return_value is not None:
+                then_func(return_value, *then_args)
+            else:
+                then_func(*then_args)
 
     def set_thread_task(self, parallel_task, then, parallel_task_args=None, then_task_args=None) -> None:
         """
@@ -78,23 +87,31 @@ class ThreadManager:
         if parallel_task_args is None:
             parallel_task_args = []
 
-        # Define a mutable object where to store the return value of the parallel task.
-        return_value_list = [None]
+        finished_threads_queue = self.__finished_threads_queue
 
         # Define a external function to act as a decorator for the parallel task given.
+        # The then task is queued even if the parallel task fails, as happened when the threads were polled.
         # noinspection PyMissingOrEmptyDocstring,PyShadowingNames
-        def parallel_routine(return_value_list, parallel_task, arg_list):
-            return_value = parallel_task(*arg_list)
-            return_value_list[0] = return_value
-
-        # Create a thread with the external function.
-        thread = Thread(target=parallel_routine, args=(return_value_list, parallel_task, parallel_task_args))
-        thread.start()
-
-        # Add thread to the list
-        self.__threads_list.append(
-            {'thread': thread,
-             'return_array': return_value_list,
-             'then_func': then,
-             'then_args': then_task_args}
-        )
+        def parallel_routine(parallel_task, arg_list):
+            return_value = None
+            try:
+                return_value = parallel_task(*arg_list)
+            except Exception:
+                # The pool stores the exceptions without showing them, print them as the threads did
+                traceback.print_exc()
+            finally:
+                finished_threads_queue.put((return_value, then, then_task_args))
+
+        # Execute the external function in one of the threads of the pool.
+        self.__thread_pool.submit(parallel_routine, parallel_task, parallel_task_args)
+
+    def shutdown(self) -> None:
+        """
+        Stop the pool of threads used by the manager.
+
+        The tasks that did not start yet are cancelled and the method returns without waiting for the running tasks,
+        their then functions are never called since the threads are not updated anymore.
+
+        Returns: None
+        """
+        self.__thread_pool.shutdown(wait=False, cancel_futures=True)
@@ -78,25 +78,23 @@ def read_info(file_name: str) -> (np.ndarray, np.ndarray, np.ndarray):
     Returns: 
         Tuple with the values of the variables X, Y and Z in the file.
     """
-    root_grp = Dataset(file_name, "r", format="NETCDF4")
+    # Read each variable from the file only once, directly into an array. The file is closed even if the variables
+    # are not defined in it.
+    with Dataset(file_name, "r", format="NETCDF4") as root_grp:
+        # The values are converted to plain arrays, so there is no need to create masked arrays when reading them
+        root_grp.set_auto_mask(False)
 
-    x = get_longitude_list_from_file(root_grp)
-    y = get_latitude_list_from_file(root_grp)
-    z = get_height_list_from_file(root_grp)
+        x = np.asarray(get_longitude_list_from_file(root_grp)[:])
+        y = np.asarray(get_latitude_list_from_file(root_grp)[:])
+        z = np.asarray(get_height_list_from_file(root_grp)[:])
 
     # If the Z variable is defined as unidimensional array, then it is necessary to flip the contents of the array once
     # it is converted to a 2D matrix since the order of the y-axis is inverted.
     if z.ndim == 1:
         log.debug("Height of file is unidimensional.")
-        z = np.array(z)
         z = z.reshape((len(y), len(x)))
         z = np.flipud(z)
 
-    # Convert the variables to arrays to return
-    x = np.array(x)
-    y = np.array(y)
-    z = np.array(z)
-
     # Change the order of the arrays if they are not sorted with ascending values
     # ---------------------------------------------------------------------------
     x_is_descending = x[0] > x[-1]
@@ -108,13 +106,10 @@ def read_info(file_name: str) -> (np.ndarray, np.ndarray, np.ndarray):
     z = np.flip(z, 0) if y_is_descending else z
     z = np.flip(z, 1) if x_is_descending else z
 
-    log.debug(f"Where X values descending: {x_is_descending}")
-    log.debug(f"Where Y values descending: {y_is_descending}")
-    log.debug(f"X values: {x}")
-    log.debug(f"Y values: {y}")
-
-    # Close the file
-    root_grp.close()
+    log.debug("Where X values descending: %s", x_is_descending)
+    log.debug("Where Y values descending: %s", y_is_descending)
+    log.debug("X values: %s", x)
+    log.debug("Y values: %s", y)
 
     return x, y, z
 
@@ -55,25 +55,27 @@ class ShapefileImporter:
         point_list = []
         parameter_list = []
 
-        for shape_record in sf.shapeRecords():
-            # Add the points to the list of points to return
-            polygon_points = shape_record.shape.points
-            if polygon_points[0] == polygon_points[-1]:
-                point_list.append(polygon_points[:-1])
-            else:
-                point_list.append(polygon_points)
-
-            # Add the parameters to the list of dictionary parameters to return
-            record_dict = shape_record.record.as_dict()
-            for k, v in record_dict.items():
-                if v is None:
-                    record_dict[k] = ''
-                elif type(v) == bool:
-                    pass
-                elif is_numeric(str(v)):
-                    record_dict[k] = float(v)
+        # Read the records one at a time instead of loading all of them in memory first, closing the files at the end
+        with sf:
+            for shape_record in sf.iterShapeRecords():
+                # Add the points to the list of points to return
+                polygon_points = shape_record.shape.points
+                if polygon_points[0] == polygon_points[-1]:
+                    point_list.append(polygon_points[:-1])
                 else:
-                    record_dict[k] = str(v)
-            parameter_list.append(record_dict)
+                    point_list.append(polygon_points)
+
+                # Add the parameters to the list of dictionary parameters to return
+                record_dict = shape_record.record.as_dict()
+                for k, v in record_dict.items():
+                    if v is None:
+                        record_dict[k] = ''
+                    elif type(v) == bool:
+                        pass
+                    elif is_numeric(str(v)):
+                        record_dict[k] = float(v)
+                    else:
+                        record_dict[k] = str(v)
+                parameter_list.append(record_dict)
 
         return point_list, parameter_list
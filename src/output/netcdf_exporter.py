@@ -32,6 +32,9 @@ class NetcdfExporter:
     Class in charge of the export of the information of models.
     """
 
+    # Number of rows of heights written to the file at once
+    __ROWS_PER_WRITE = 512
+
     def __init__(self):
         """
         Constructor of the class
@@ -95,18 +98,29 @@ class NetcdfExporter:
             heights = np.fliplr(heights)
 
         # Get the shape of the file and change only the data that is defined in the inside of the variable that stores
-        # the heights of the file
+        # the heights of the file. The shape is read from the variable metadata, without reading its data.
         # ------------------------------------------------------------------------------------------------------------
-        height_shape = np.array(root_grp.variables[height_key]).shape
-        root_grp.variables[height_key][:] = heights.reshape(height_shape)
+        height_variable = root_grp.variables[height_key]
+        height_shape = height_variable.shape
+
+        # Heights with the same shape as the variable are written by blocks of rows, so the non-contiguous array of
+        # heights is never copied completely in memory
+        if heights.shape == height_shape:
+            for first_row in range(0, height_shape[0], self.__ROWS_PER_WRITE):
+                last_row = first_row + self.__ROWS_PER_WRITE
+                height_variable[first_row:last_row] = heights[first_row:last_row]
+        else:
+            height_variable[:] = heights.reshape(height_shape)
 
         # Change the metadata of the file to match the new heights
         # --------------------------------------------------------
+        height_range = [np.nanmin(heights), np.nanmax(heights)]
+
         if 'z_range' in file_keys:
-            root_grp.variables['z_range'][:] = [np.nanmin(heights), np.nanmax(heights)]
+            root_grp.variables['z_range'][:] = height_range
 
-        if 'actual_range' in root_grp.variables[height_key].ncattrs():
-            root_grp.variables[height_key].actual_range = np.array([np.nanmin(heights), np.nanmax(heights)])
+        if 'actual_range' in height_variable.ncattrs():
+            height_variable.actual_range = np.array(height_range)
 
         # Close the file
         # --------------
@@ -126,7 +140,7 @@ class NetcdfExporter:
 
         Returns: None
         """
-        new_filename = f'{filename}.nc' if filename[-3:] != '.nc' else filename
+        new_filename = f'{filename}.nc' if not filename.endswith('.nc') else filename
         root_grp = Dataset(new_filename, "w", format="NETCDF4")
         root_grp.createDimension('lon', len(vertices[0]))
         root_grp.createDimension('lat', len(vertices))
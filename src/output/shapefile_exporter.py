@@ -21,7 +21,7 @@ File that contains the class shapefileExporter.
 import shapefile
 
 from src.error.export_error import ExportError
-from src.utils import is_clockwise
+from src.utils import delete_z_axis, is_clockwise
 
 
 class ShapefileExporter:
@@ -35,31 +35,6 @@ class ShapefileExporter:
         """
         pass
 
-    def __delete_z_axis(self, list_of_points: list) -> list:
-        """
-        Delete the third component of a list of points, returning a list only with the first two components of
-        each point.
-
-        input: [a.x,a.y,a.z,b.x,b.y,b.z,c.x,...]
-        output: [[a.x,a.y],[b.x,b.y],[c.x,...]
-
-        Args:
-            list_of_points: List of points to use
-
-        Returns: List with the points without the third component
-        """
-        new_list = []
-        pair_used = []
-        for component_ind in range(len(list_of_points)):
-            if component_ind % 3 == 0:
-                pair_used.append(list_of_points[component_ind])
-            elif component_ind % 3 == 1:
-                pair_used.append(list_of_points[component_ind])
-            elif component_ind % 3 == 2:
-                new_list.append(pair_used)
-                pair_used = []
-        return new_list
-
     def export_list_of_polygons(self, list_of_points: list, list_of_parameters: list, list_of_polygon_names: list,
                                 directory: str) -> None:
         """
@@ -94,7 +69,7 @@ class ShapefileExporter:
                 raise ExportError(1)
 
             # Sort the points to be counter clockwise
-            points = self.__delete_z_axis(list_of_points[ind])
+            points = delete_z_axis(list_of_points[ind])
             if is_clockwise(points):
                 points.reverse()  # polygons must be defined CCW
 
@@ -197,7 +172,7 @@ class ShapefileExporter:
                 parameters[k] = str(v)
 
         # Save the polygons
-        points = self.__delete_z_axis(list_of_points)
+        points = delete_z_axis(list_of_points)
         if is_clockwise(points):
             points.reverse()  # polygons must be defined CCW
 
@@ -99,7 +99,7 @@ class Program:
             self.__zoom_level += 1
         else:
             self.__zoom_level *= 2
-        log.debug(f"zoom level: {self.__zoom_level}")
+        log.debug("zoom level: %s", self.__zoom_level)
 
     def check_model_temp_file_exists(self) -> bool:
         """
@@ -243,7 +243,7 @@ class Program:
             self.__zoom_level -= 1
         else:
             self.__zoom_level /= 2
-        log.debug(f"zoom level: {self.__zoom_level}")
+        log.debug("zoom level: %s", self.__zoom_level)
 
     def load_cpt_file_with_dialog(self) -> None:
         """
@@ -252,7 +252,7 @@ class Program:
         Returns: None
         """
         path_color_file = self.open_openbox_dialog('Select CPT file...')
-        log.debug(f"path_color_file: {path_color_file}")
+        log.debug("path_color_file: %s", path_color_file)
 
         self.set_cpt_file(path_color_file)
         self.__engine.update_scene_models_colors()
@@ -267,8 +267,8 @@ class Program:
         path_model = self.open_openbox_dialog('Select NETCDF file...')
         path_color_file = self.get_cpt_file()
 
-        log.debug(f"path_model: {path_model}")
-        log.debug(f"path_color_File: {path_color_file}")
+        log.debug("path_model: %s", path_model)
+        log.debug("path_color_File: %s", path_color_file)
 
         if path_model is not None and path_color_file is not None:
             self.__engine.create_model_from_file(path_color_file, path_model)
@@ -321,7 +321,7 @@ class Program:
         Returns: File selected by the user.
         """
         path_to_file = easygui.fileopenbox(message)
-        log.debug(f"Path to file: {path_to_file}")
+        log.debug("Path to file: %s", path_to_file)
 
         if path_to_file is None:
             raise FileNotFoundError('File not selected.')
@@ -20,7 +20,7 @@ File with utils functions for the engine.
 """
 import json
 import logging
-from typing import Union
+from typing import List, Union
 
 import numpy as np
 
@@ -139,10 +139,28 @@ def is_clockwise(points):
     """
     assert len(points) > 2, 'Need at least 3 points to work.'
 
-    s = 0.0
-    for p1, p2 in zip(points, points[1:] + [points[0]]):
-        s += (p2[0] - p1[0]) * (p2[1] + p1[1])
-    return s > 0.0
+    # Shoelace formula computed over all the edges at once, each point paired with the next one
+    points_array = np.asarray(points, dtype=float)
+    next_points_array = np.roll(points_array, -1, axis=0)
+    s = np.sum((next_points_array[:, 0] - points_array[:, 0]) * (next_points_array[:, 1] + points_array[:, 1]))
+    return bool(s > 0.0)
+
+
+def delete_z_axis(list_of_points: List[float]) -> list:
+    """
+    Delete the third component of a list of points, returning a list only with the first two components of
+    each point.
+
+    input: [a.x,a.y,a.z,b.x,b.y,b.z,c.x,...]
+    output: [[a.x,a.y],[b.x,b.y],[c.x,...]
+
+    Args:
+        list_of_points: List of points to use
+
+    Returns: List with the points without the third component
+    """
+    # Zip the three components so incomplete points at the end of the list are discarded
+    return [[x, y] for x, y, _ in zip(list_of_points[0::3], list_of_points[1::3], list_of_points[2::3])]
 
 
 def list_to_serializable_list(list_obj: Union[list, tuple]) -> list:
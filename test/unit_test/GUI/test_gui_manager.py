@@ -0,0 +1,71 @@
+#  BEGIN GPL LICENSE BLOCK
+#
+#      This program is free software: you can redistribute it and/or modify
+#      it under the terms of the GNU General Public License as published by
+#      the Free Software Foundation, either version 3 of the License, or
+#      (at your option) any later version.
+#
+#      This program is distributed in the hope that it will be useful,
+#      but WITHOUT ANY WARRANTY; without even the implied warranty of
+#      MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#      GNU General Public License for more details.
+#
+#      You should have received a copy of the GNU General Public License
+#      along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+#  END GPL LICENSE BLOCK
+
+"""
+Module with test related to the GUI manager of the program.
+"""
+import unittest
+
+from src.engine.settings import Settings
+from test.test_case import ProgramTestCase
+
+
+class TestRedraw(ProgramTestCase):
+
+    def setUp(self) -> None:
+        """
+        Process the frames that are pending to be redrawn when the program starts.
+        """
+        super().setUp()
+        self.gui_manager = self.engine.gui_manager
+        for _ in range(Settings.REDRAW_FRAMES):
+            self.gui_manager.process_input()
+
+    def test_redraw_not_needed_without_events(self):
+        self.assertFalse(self.gui_manager.is_redraw_needed(),
+                         'GUI must not be redrawn if there are no frames pending to be redrawn.')
+
+    def test_request_redraw(self):
+        self.gui_manager.request_redraw()
+
+        # The GUI is redrawn on the number of frames defined in the settings
+        for _ in range(Settings.REDRAW_FRAMES):
+            self.assertTrue(self.gui_manager.is_redraw_needed(),
+                            'GUI must be redrawn while there are frames pending to be redrawn.')
+            self.gui_manager.process_input()
+
+        self.assertFalse(self.gui_manager.is_redraw_needed(),
+                         'GUI must not be redrawn after drawing the frames pending to be redrawn.')
+
+    def test_request_redraw_does_not_reduce_frames(self):
+        self.gui_manager.request_redraw()
+        for _ in range(Settings.REDRAW_FRAMES - 1):
+            self.gui_manager.process_input()
+
+        # A new request restart the count of the frames to redraw
+        self.gui_manager.request_redraw()
+        for _ in range(Settings.REDRAW_FRAMES):
+            self.assertTrue(self.gui_manager.is_redraw_needed(),
+                            'GUI must be redrawn while there are frames pending to be redrawn.')
+            self.gui_manager.process_input()
+
+        self.assertFalse(self.gui_manager.is_redraw_needed(),
+                         'GUI must not be redrawn after drawing the frames pending to be redrawn.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,7 +23,7 @@ import unittest
 
 import numpy as np
 
-from src.engine.scene.geometrical_operations import get_max_min_inside_polygon, merge_matrices
+from src.engine.scene.geometrical_operations import get_max_min_inside_polygon, get_polygon_mask, merge_matrices
 
 
 class TestMinMaxPolygon(unittest.TestCase):
@@ -99,6 +99,67 @@ class TestMinMaxPolygon(unittest.TestCase):
         self.assertEqual((np.nan, np.nan), (max_, min_),
                          'Minimum and maximum values are not the one inside the polygon.')
 
+    def test_min_max_no_points_inside_bounding_box(self):
+
+        # create and set the points on the grid
+        points = np.zeros((10, 10, 3))
+        for row in range(10):
+            for col in range(10):
+                points[row, col, 0] = col
+                points[row, col, 1] = row
+
+        # create the polygon and a mask with points on its bounding box but none of them inside the polygon
+        polygon_points = [0.5, 0.5, 0,
+                          2.5, 0.5, 0,
+                          0.5, 2.5, 0]
+        polygon_mask = ([1, 3, 1, 3], np.zeros((2, 2), dtype=bool))
+
+        # create heights of the map
+        height = np.ones((10, 10))
+        height = height * 150
+
+        (max_, min_) = get_max_min_inside_polygon(points,
+                                                  polygon_points,
+                                                  height,
+                                                  polygon_mask)
+        self.assertTrue(np.isnan(max_) and np.isnan(min_),
+                        'Minimum and maximum values must be nan if there are no points inside the polygon.')
+
+    def test_min_max_reused_mask(self):
+
+        # create and set the points on the grid
+        points = np.zeros((10, 10, 3))
+        for row in range(10):
+            for col in range(10):
+                points[row, col, 0] = col
+                points[row, col, 1] = row
+
+        # create the polygon and its mask
+        polygon_points = [0.9, 0, 0,
+                          5, 0, 0,
+                          1, 5, 0]
+        polygon_mask = get_polygon_mask(points, polygon_points)
+
+        # create heights of the map
+        height = np.zeros((10, 10))
+        height[1, 1] = -15
+        height[2, 2] = 30
+
+        self.assertEqual((30, -15), get_max_min_inside_polygon(points,
+                                                               polygon_points,
+                                                               height,
+                                                               polygon_mask),
+                         'Minimum and maximum values are not the one inside the polygon.')
+
+        # change the heights of the map, the mask must still be valid
+        height[2, 2] = 45
+
+        self.assertEqual((45, -15), get_max_min_inside_polygon(points,
+                                                               polygon_points,
+                                                               height,
+                                                               polygon_mask),
+                         'Minimum and maximum values are not the one inside the polygon.')
+
 
 class TestMergeMatrices(unittest.TestCase):
 
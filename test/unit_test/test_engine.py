@@ -22,6 +22,7 @@ Module with test related to the engine of the program.
 import time
 import unittest
 
+from src.engine.settings import Settings
 from src.program.program import Program
 from src.program.view_mode import ViewMode
 from src.utils import dict_to_serializable_dict, json_to_dict
@@ -256,5 +257,48 @@ class TestSetThreadTask(ProgramTestCase):
                 break
 
 
+
+class TestRedraw(ProgramTestCase):
+
+    def setUp(self) -> None:
+        """
+        Process the frames that are pending to be redrawn when the program starts.
+        """
+        super().setUp()
+        for _ in range(Settings.REDRAW_FRAMES):
+            self.engine.gui_manager.process_input()
+
+    def test_redraw_not_needed_without_events(self):
+        self.assertFalse(self.engine.is_redraw_needed(),
+                         'Frame must not be drawn if nothing changed since the last frame.')
+
+    def test_redraw_requested(self):
+        self.engine.request_redraw()
+        self.assertTrue(self.engine.is_redraw_needed(),
+                        'Frame must be drawn after a redraw is requested.')
+
+    def test_redraw_while_loading(self):
+        self.program.set_loading(True)
+        self.assertTrue(self.engine.is_redraw_needed(),
+                        'Frames must be drawn while the program is loading.')
+
+    def test_redraw_while_pending_tasks(self):
+        self.engine.wait_loading_frame_render = True
+        self.engine.set_task_with_loading_frame(lambda: None)
+
+        # Only the pending task must keep drawing the frames
+        self.program.set_loading(False)
+        for _ in range(Settings.REDRAW_FRAMES):
+            self.engine.gui_manager.process_input()
+
+        self.assertTrue(self.engine.is_redraw_needed(),
+                        'Frames must be drawn while there are tasks waiting to be executed.')
+
+    def test_redraw_while_running_processes(self):
+        self.engine.set_process_task(time.sleep, lambda: None, [0])
+        self.assertTrue(self.engine.is_redraw_needed(),
+                        'Frames must be drawn while there are processes running.')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -164,6 +164,23 @@ class TestProcessTask(unittest.TestCase):
         # Return values to normal
         TEST_MUTABLE_OBJECT[1] = None
 
+    def test_has_running_processes(self):
+        pm = ProcessManager()
+        self.assertFalse(pm.has_running_processes())
+
+        pm.create_parallel_process(do_nothing_function)
+        self.assertTrue(pm.has_running_processes())
+
+        # Wait for the process to end and execute its then logic
+        for process_creation_time in PROCESS_CREATION_TIMES:
+            time.sleep(process_creation_time)
+            pm.update_process()
+
+            if not pm.has_running_processes():
+                break
+
+        self.assertFalse(pm.has_running_processes())
+
     def test_real_parallel_task_execution(self):
         pm = ProcessManager()
 
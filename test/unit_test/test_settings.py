@@ -57,5 +57,38 @@ class TestFixFrames(unittest.TestCase):
                          Settings.SCENE_HEIGHT_Y)
 
 
+class TestVersion(unittest.TestCase):
+
+    def test_version_changes_with_scene_values(self):
+        initial_version = Settings.VERSION
+
+        # Update the values and check that the version changed
+        Settings.fix_frames(False)
+        self.assertNotEqual(initial_version, Settings.VERSION)
+
+        version = Settings.VERSION
+        Settings.fix_frames(True)
+        self.assertNotEqual(version, Settings.VERSION)
+
+
+class TestChangeWindowSize(unittest.TestCase):
+
+    def test_change_window_size(self):
+        width, height = Settings.WIDTH, Settings.HEIGHT
+        initial_version = Settings.VERSION
+
+        # Change the size and check the scene values and the version
+        Settings.change_window_size(1000, 800)
+        self.assertEqual(1000, Settings.WIDTH)
+        self.assertEqual(800, Settings.HEIGHT)
+        self.assertEqual(1000 - Settings.LEFT_FRAME_WIDTH, Settings.SCENE_WIDTH_X)
+        self.assertEqual(800 - Settings.MAIN_MENU_BAR_HEIGHT - Settings.TOP_FRAME_HEIGHT,
+                         Settings.SCENE_HEIGHT_Y)
+        self.assertNotEqual(initial_version, Settings.VERSION)
+
+        # Restore the original size
+        Settings.change_window_size(width, height)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -72,6 +72,72 @@ class TestSetTask(unittest.TestCase):
         self.assertEqual(100, mutable_object[0])
         self.assertIsNone(mutable_object[1])
 
+    def test_set_task_inside_task(self):
+        # Create Task manager and mutable object to store the information within
+        tm = TaskManager()
+        mutable_object = [None, None]
+
+        # Set a task that set another task when executed
+        # noinspection PyMissingOrEmptyDocstring
+        def modify_mutable_object(ind, value):
+            mutable_object[ind] = value
+
+        tm.set_task(lambda: tm.set_task(lambda: modify_mutable_object(1, 200), 1), 1)
+
+        # Update the manager to execute the first task, the second one must wait for the next frame
+        tm.update_tasks()
+        self.assertIsNone(mutable_object[1])
+
+        # Update the manager to execute the second task
+        tm.update_tasks()
+        self.assertEqual(200, mutable_object[1])
+
+    def test_task_with_error(self):
+        # Create Task manager and mutable object to store the information within
+        tm = TaskManager()
+        mutable_object = [None, None]
+
+        # noinspection PyMissingOrEmptyDocstring
+        def modify_mutable_object(ind, value):
+            mutable_object[ind] = value
+
+        # noinspection PyMissingOrEmptyDocstring
+        def raise_error():
+            raise ValueError('Error in task.')
+
+        # Set a task that raises an error between two tasks that must not be discarded
+        tm.set_task(lambda: modify_mutable_object(0, 100), 2)
+        tm.set_task(raise_error, 1)
+        tm.set_task(lambda: modify_mutable_object(1, 200), 1)
+
+        with self.assertRaises(ValueError):
+            tm.update_tasks()
+
+        # The other tasks are still pending after the error
+        self.assertTrue(tm.has_pending_tasks())
+        self.assertIsNone(mutable_object[0])
+        self.assertIsNone(mutable_object[1])
+
+        # Update the manager to execute the remaining tasks
+        tm.update_tasks()
+        self.assertEqual(100, mutable_object[0])
+        self.assertEqual(200, mutable_object[1])
+        self.assertFalse(tm.has_pending_tasks())
+
+    def test_has_pending_tasks(self):
+        tm = TaskManager()
+        self.assertFalse(tm.has_pending_tasks())
+
+        # Tasks are pending until executed
+        tm.set_task(lambda: None, 2)
+        self.assertTrue(tm.has_pending_tasks())
+
+        tm.update_tasks()
+        self.assertTrue(tm.has_pending_tasks())
+
+        tm.update_tasks()
+        self.assertFalse(tm.has_pending_tasks())
+
     def test_error_number_frames(self):
         tm = TaskManager()
         with self.assertRaises(AssertionError):